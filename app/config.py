@@ -0,0 +1,183 @@
+import os
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+# Upstream endpoints; point these at a stand-in server (benchmarks/standin.py) to research offline
+SERPAPI_URL = os.getenv("SERPAPI_URL", "https://serpapi.com/search.json")
+SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY", "demo")
+WIKIPEDIA_API_URL = os.getenv("WIKIPEDIA_API_URL", "https://en.wikipedia.org/w/api.php")
+WIKIPEDIA_PAGE_URL = os.getenv("WIKIPEDIA_PAGE_URL", "https://en.wikipedia.org/wiki/")
+SERPAPI_HOST = urlparse(SERPAPI_URL).hostname or ""
+WIKIPEDIA_HOST = urlparse(WIKIPEDIA_API_URL).hostname or ""
+
+# Research scheduler
+RESEARCH_MAX_CONCURRENCY = _env_int("RESEARCH_MAX_CONCURRENCY", 10)
+HOST_DEFAULT_CONCURRENCY = _env_int("HOST_DEFAULT_CONCURRENCY", 4)
+HOST_DEFAULT_RATE: Tuple[float, float] = (
+    _env_float("HOST_DEFAULT_RATE", 5.0),
+    _env_float("HOST_DEFAULT_BURST", 10.0),
+)
+
+# host -> max concurrent requests
+HOST_CONCURRENCY: Dict[str, int] = {
+    WIKIPEDIA_HOST: _env_int("WIKIPEDIA_CONCURRENCY", 8),
+    SERPAPI_HOST: _env_int("SERPAPI_CONCURRENCY", 4),
+}
+
+# host -> (requests per second, burst size)
+HOST_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    WIKIPEDIA_HOST: (_env_float("WIKIPEDIA_RATE", 20.0), _env_float("WIKIPEDIA_BURST", 40.0)),
+    SERPAPI_HOST: (_env_float("SERPAPI_RATE", 5.0), _env_float("SERPAPI_BURST", 5.0)),
+}
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 10
+
+# Shared HTTP connection pool
+HTTP_USER_AGENT = os.getenv("HTTP_USER_AGENT", "Startup-Research-App/1.0")
+HTTP_POOL_LIMIT = _env_int("HTTP_POOL_LIMIT", 100)
+HTTP_POOL_LIMIT_PER_HOST = _env_int("HTTP_POOL_LIMIT_PER_HOST", 10)
+HTTP_DNS_CACHE_TTL = _env_int("HTTP_DNS_CACHE_TTL", 300)
+HTTP_KEEPALIVE_TIMEOUT = _env_float("HTTP_KEEPALIVE_TIMEOUT", 30.0)
+HTTP_TIMEOUT = _env_float("HTTP_TIMEOUT", 15.0)
+HTTP_CONNECT_TIMEOUT = _env_float("HTTP_CONNECT_TIMEOUT", 5.0)
+WEBSITE_TIMEOUT = _env_float("WEBSITE_TIMEOUT", 10.0)
+
+# Persistent HTTP response cache
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "1") not in ("0", "false", "False")
+HTTP_CACHE_PATH = os.getenv("HTTP_CACHE_PATH", "http_cache.db")
+HTTP_CACHE_MAX_BYTES = _env_int("HTTP_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+HTTP_CACHE_DEFAULT_TTL = _env_int("HTTP_CACHE_DEFAULT_TTL", 6 * 3600)
+# cache hits record their access time in memory; it is written back at most this often (and before eviction)
+HTTP_CACHE_ACCESS_FLUSH_INTERVAL = _env_float("HTTP_CACHE_ACCESS_FLUSH_INTERVAL", 60.0)
+
+# host -> seconds a cached response is served without revalidation
+HTTP_CACHE_TTLS: Dict[str, int] = {
+    WIKIPEDIA_HOST: _env_int("WIKIPEDIA_CACHE_TTL", 24 * 3600),
+    SERPAPI_HOST: _env_int("SERPAPI_CACHE_TTL", 24 * 3600),
+}
+
+# Batched Wikipedia lookups
+# prop=extracts only returns several intro extracts per request up to exlimit=20
+WIKIPEDIA_EXTRACT_BATCH_SIZE = _env_int("WIKIPEDIA_EXTRACT_BATCH_SIZE", 20)
+WIKIPEDIA_WIKITEXT_BATCH_SIZE = _env_int("WIKIPEDIA_WIKITEXT_BATCH_SIZE", 50)
+# seconds a found page id waits for others to share its extract/wikitext requests
+WIKIPEDIA_BATCH_WINDOW = _env_float("WIKIPEDIA_BATCH_WINDOW", 0.05)
+
+# SQLite connection pool
+DATABASE_PATH = os.getenv("DATABASE_PATH", "startups.db")
+DB_POOL_SIZE = _env_int("DB_POOL_SIZE", 8)
+DB_BUSY_TIMEOUT = _env_float("DB_BUSY_TIMEOUT", 30.0)
+DB_CACHE_SIZE_KB = _env_int("DB_CACHE_SIZE_KB", 64 * 1024)
+DB_MMAP_SIZE = _env_int("DB_MMAP_SIZE", 256 * 1024 * 1024)
+DB_STATEMENT_CACHE_SIZE = _env_int("DB_STATEMENT_CACHE_SIZE", 256)
+DB_THREAD_POOL_SIZE = _env_int("DB_THREAD_POOL_SIZE", DB_POOL_SIZE)
+
+# In-memory LRU of hot GET /api/startups/{id} lookups (entries, 0 disables; seconds)
+STARTUP_CACHE_SIZE = _env_int("STARTUP_CACHE_SIZE", 1024)
+STARTUP_CACHE_TTL = _env_float("STARTUP_CACHE_TTL", 300.0)
+# event-loop hits need a check for other processes' writes younger than this (seconds); older ones go to the thread pool
+STARTUP_CACHE_VERSION_INTERVAL = _env_float("STARTUP_CACHE_VERSION_INTERVAL", 1.0)
+
+# Buffered result writes
+WRITE_BATCH_SIZE = _env_int("WRITE_BATCH_SIZE", 100)
+WRITE_FLUSH_INTERVAL = _env_float("WRITE_FLUSH_INTERVAL", 1.0)
+
+# Wikipedia text extraction rules (industry taxonomy and field patterns)
+EXTRACTION_RULES_PATH = os.getenv(
+    "EXTRACTION_RULES_PATH",
+    os.path.join(os.path.dirname(__file__), "data", "extraction_rules.json")
+)
+
+# HTML parsing runs off the event loop; backend is auto, lxml, html.parser or selectolax
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "auto")
+HTML_PARSER_POOL = os.getenv("HTML_PARSER_POOL", "thread")
+HTML_PARSER_WORKERS = _env_int("HTML_PARSER_WORKERS", 4)
+
+# Homepage downloads are streamed and cut off early instead of buffered whole
+WEBSITE_MAX_BYTES = _env_int("WEBSITE_MAX_BYTES", 1024 * 1024)
+WEBSITE_CHUNK_SIZE = _env_int("WEBSITE_CHUNK_SIZE", 64 * 1024)
+WEBSITE_MAX_LINKS = _env_int("WEBSITE_MAX_LINKS", 300)
+WEBSITE_CONTENT_TYPES = tuple(
+    t.strip() for t in os.getenv("WEBSITE_CONTENT_TYPES", "text/html,application/xhtml+xml").split(",") if t.strip()
+)
+
+# Durable background research jobs
+JOB_WORKERS = _env_int("JOB_WORKERS", 4)
+JOB_BATCH_SIZE = _env_int("JOB_BATCH_SIZE", 20)
+JOB_MAX_ATTEMPTS = _env_int("JOB_MAX_ATTEMPTS", 3)
+JOB_RETRY_BACKOFF = _env_float("JOB_RETRY_BACKOFF", 30.0)
+JOB_POLL_INTERVAL = _env_float("JOB_POLL_INTERVAL", 2.0)
+# workers touch their running items this often; items untouched for the timeout are handed to other workers
+JOB_HEARTBEAT_INTERVAL = _env_float("JOB_HEARTBEAT_INTERVAL", 10.0)
+JOB_HEARTBEAT_TIMEOUT = _env_float("JOB_HEARTBEAT_TIMEOUT", 60.0)
+
+# GET /api/startups page sizes
+STARTUPS_PAGE_SIZE = _env_int("STARTUPS_PAGE_SIZE", 100)
+STARTUPS_MAX_PAGE_SIZE = _env_int("STARTUPS_MAX_PAGE_SIZE", 1000)
+
+# Re-research only refetches sources older than their max age (seconds) unless forced
+SOURCE_MAX_AGE: Dict[str, int] = {
+    "website": _env_int("WEBSITE_MAX_AGE", 7 * 24 * 3600),
+    "wikipedia": _env_int("WIKIPEDIA_MAX_AGE", 30 * 24 * 3600),
+    "news": _env_int("NEWS_MAX_AGE", 24 * 3600),
+}
+
+# Per-company research stages run as a dependency graph; each is cut off after its timeout (seconds, 0 disables)
+STAGE_TIMEOUTS: Dict[str, float] = {
+    "serpapi_search": _env_float("SERPAPI_STAGE_TIMEOUT", 30.0),
+    "website_fetch": _env_float("WEBSITE_STAGE_TIMEOUT", 30.0),
+    "wikipedia": _env_float("WIKIPEDIA_STAGE_TIMEOUT", 120.0),
+    "news": _env_float("NEWS_STAGE_TIMEOUT", 30.0),
+}
+
+# Each company's research must finish within this many seconds once it starts (0 disables); stages cut off by
+# the deadline leave their fields listed in Startup.missing_fields. A share caps the part of the remaining
+# budget one stage may use, leaving time for the stages that depend on it.
+RESEARCH_DEADLINE = _env_float("RESEARCH_DEADLINE", 20.0)
+STAGE_BUDGET_SHARES: Dict[str, float] = {
+    "serpapi_search": _env_float("SERPAPI_BUDGET_SHARE", 0.4),
+}
+
+# Transient upstream errors (connection errors, timeouts, 429 and 5xx) are retried with jittered backoff
+HTTP_MAX_RETRIES = _env_int("HTTP_MAX_RETRIES", 2)
+HTTP_RETRY_BACKOFF = _env_float("HTTP_RETRY_BACKOFF", 0.25)
+HTTP_RETRY_MAX_BACKOFF = _env_float("HTTP_RETRY_MAX_BACKOFF", 4.0)
+
+# Per-host circuit breakers fail fast after consecutive failures, probing again after the reset timeout
+CIRCUIT_FAILURE_THRESHOLD = _env_int("CIRCUIT_FAILURE_THRESHOLD", 5)
+CIRCUIT_RESET_TIMEOUT = _env_float("CIRCUIT_RESET_TIMEOUT", 30.0)
+
+# Send a second, identical Wikipedia request when the first has not answered after this many seconds (0 disables)
+WIKIPEDIA_HEDGE_AFTER = _env_float("WIKIPEDIA_HEDGE_AFTER", 0.0)
+
+# Duplicate research of one company is coalesced in-process and leased across worker processes
+RESEARCH_LEASE_TTL = _env_float("RESEARCH_LEASE_TTL", 120.0)
+RESEARCH_LEASE_POLL = _env_float("RESEARCH_LEASE_POLL", 0.5)
+
+# Logging: records go through a queue to a background thread that writes a size-rotated file
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FILE = os.getenv("LOG_FILE", os.path.join("logs", "app.log"))
+LOG_MAX_BYTES = _env_int("LOG_MAX_BYTES", 50 * 1024 * 1024)
+LOG_BACKUP_COUNT = _env_int("LOG_BACKUP_COUNT", 5)
+# fraction of full payload dumps (scraped data, combined records) that are written
+LOG_PAYLOAD_SAMPLE_RATE = _env_float("LOG_PAYLOAD_SAMPLE_RATE", 0.01)
+# per-logger overrides, e.g. "app.services.scraper_service=DEBUG,aiohttp=WARNING"
+LOG_LEVELS: Dict[str, str] = dict(
+    item.split("=", 1) for item in os.getenv("LOG_LEVELS", "aiohttp=WARNING").split(",") if "=" in item
+)
@@ -0,0 +1,87 @@
+import atexit
+import itertools
+import logging
+import logging.handlers
+import os
+import queue
+from typing import Dict, Optional
+
+from . import config
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# pass as extra= on logs that dump whole payloads; only a sample of them is written
+PAYLOAD = {"payload": True}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class PayloadSampler(logging.Filter):
+    """Keeps one in every 1/rate payload records per message template.
+
+    Runs on the queue handler, so dropped payloads are never formatted.
+    """
+
+    def __init__(self, rate: float = config.LOG_PAYLOAD_SAMPLE_RATE):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._counters: Dict[str, itertools.count] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "payload", False):
+            return True
+        if not self.every:
+            return False
+        counter = self._counters.setdefault(record.msg, itertools.count())
+        return next(counter) % self.every == 0
+
+
+def setup_logging(
+    level: str = config.LOG_LEVEL,
+    log_file: Optional[str] = config.LOG_FILE,
+    module_levels: Dict[str, str] = config.LOG_LEVELS
+) -> logging.handlers.QueueListener:
+    """Route all logging through a queue so request and scraper code never waits on disk writes."""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        handlers.append(logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=config.LOG_MAX_BYTES,
+            backupCount=config.LOG_BACKUP_COUNT,
+            encoding="utf-8"
+        ))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(PayloadSampler())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+    for name, module_level in module_levels.items():
+        logging.getLogger(name.strip()).setLevel(module_level.strip().upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """Write out queued records and stop the background writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -16,4 +16,8 @@ class Startup(BaseModel):
     products: Optional[List[str]] = None
     social_media: Optional[Dict[str, str]] = None
     news: Optional[List[Dict[str, Any]]] = None
+    # source ("website", "wikipedia", "news") -> when it was last fetched successfully
+    source_updated: Optional[Dict[str, datetime]] = None
+    # fields left as placeholders because their source failed or ran past the research deadline
+    missing_fields: Optional[List[str]] = None
     last_updated: datetime = Field(default_factory=datetime.now)
\ No newline at end of file
@@ -0,0 +1,106 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple
+import logging
+
+from ..models.startup import Startup
+from .database import DatabaseService, get_database_service
+from .startup_cache import CachedStartup
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabaseService:
+    """Awaitable facade over DatabaseService.
+
+    Every query and pydantic parse runs on a dedicated thread pool sized to the
+    connection pool, so SQLite work never blocks the event loop that drives the
+    scrapers and the API.
+    """
+
+    def __init__(self, db: DatabaseService, max_workers: int = config.DB_THREAD_POOL_SIZE):
+        self.db = db
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db")
+
+    async def run(self, func: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def save_startup(self, startup: Startup) -> bool:
+        return await self.run(self.db.save_startup, startup)
+
+    async def save_startups(self, startups: List[Startup]) -> bool:
+        return await self.run(self.db.save_startups, startups)
+
+    async def get_startup(self, startup_id: str) -> Optional[Startup]:
+        return await self.run(self.db.get_startup, startup_id)
+
+    async def get_startup_entry(self, startup_id: str) -> Optional[CachedStartup]:
+        # recent cache hits are answered on the event loop without a hop to the thread pool;
+        # the cross-process version check runs on the pool with the lookup that follows
+        entry = self.db.cache.get_nowait(startup_id)
+        if entry is not None:
+            return entry
+        return await self.run(self.db.get_startup_entry, startup_id)
+
+    async def get_startups(self, startup_ids: List[str]) -> Dict[str, Startup]:
+        return await self.run(self.db.get_startups, startup_ids)
+
+    async def get_all_startups(self) -> List[Startup]:
+        return await self.run(self.db.get_all_startups)
+
+    async def list_startups(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        **filters
+    ) -> Tuple[List[str], Optional[str]]:
+        return await self.run(self.db.list_startups, limit, cursor, fields, **filters)
+
+    async def get_field_map(self, column: str) -> Dict[str, Any]:
+        return await self.run(self.db.get_field_map, column)
+
+    async def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        match_all: bool = True,
+        parse: bool = True
+    ) -> List[Dict[str, Any]]:
+        return await self.run(self.db.search, query, limit, offset, match_all, parse)
+
+    async def search_startups(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        match_all: bool = True
+    ) -> List[Startup]:
+        return await self.run(self.db.search_startups, query, limit, offset, match_all)
+
+    async def run_analytics(self, query_type: str) -> Dict[str, Any]:
+        return await self.run(self.db.run_analytics, query_type)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+_async_db_service: Optional[AsyncDatabaseService] = None
+
+
+def get_async_database_service() -> AsyncDatabaseService:
+    global _async_db_service
+    if _async_db_service is None:
+        _async_db_service = AsyncDatabaseService(get_database_service())
+    return _async_db_service
+
+
+def close_async_database_service():
+    global _async_db_service
+    if _async_db_service is not None:
+        _async_db_service.close()
+        _async_db_service = None
@@ -0,0 +1,98 @@
+import time
+from typing import Dict, Optional
+import logging
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one host.
+
+    After failure_threshold failures in a row the circuit opens and requests fail
+    fast for reset_timeout seconds; then a single probe is let through, which
+    closes the circuit on success or opens it again on failure.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = config.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = config.CIRCUIT_RESET_TIMEOUT
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self):
+        if self.opened_at is not None:
+            logger.info("Circuit for %s closed", self.host)
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def release(self):
+        """The request ended without an outcome (cancelled); let another probe through if it was one."""
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._probing or (self.opened_at is None and self.failures >= self.failure_threshold):
+            logger.warning("Circuit for %s opened after %s consecutive failures", self.host, self.failures)
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+
+class CircuitBreakers:
+    def __init__(
+        self,
+        failure_threshold: int = config.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = config.CIRCUIT_RESET_TIMEOUT
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hosts: Dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        breaker = self.hosts.get(host)
+        if breaker is None:
+            breaker = self.hosts[host] = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+        return breaker
+
+    def stats(self) -> Dict[str, str]:
+        return {host: breaker.state for host, breaker in self.hosts.items() if breaker.state != "closed"}
+
+
+_circuit_breakers: Optional[CircuitBreakers] = None
+
+
+def get_circuit_breakers() -> CircuitBreakers:
+    global _circuit_breakers
+    if _circuit_breakers is None:
+        _circuit_breakers = CircuitBreakers()
+    return _circuit_breakers
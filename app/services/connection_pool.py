@@ -0,0 +1,99 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict
+import logging
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """Process-wide pool of tuned SQLite connections for one database file.
+
+    Connections run in WAL mode so readers never block on the writer, and each
+    keeps its own prepared-statement cache, so the fixed SQL strings used by
+    DatabaseService are compiled once per connection instead of once per call.
+    """
+
+    def __init__(self, db_path: str, size: int = config.DB_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=config.DB_BUSY_TIMEOUT,
+            check_same_thread=False,
+            cached_statements=config.DB_STATEMENT_CACHE_SIZE
+        )
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA cache_size = -{config.DB_CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA mmap_size = {config.DB_MMAP_SIZE}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    return self._open()
+                except Exception:
+                    self._created -= 1
+                    raise
+        return self._idle.get()
+
+    @contextmanager
+    def connection(self):
+        conn = self._acquire()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def close(self):
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                    self._created -= 1
+                except queue.Empty:
+                    break
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = ConnectionPool(db_path)
+            _pools[db_path] = pool
+        return pool
+
+
+def close_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
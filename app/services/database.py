@@ -1,143 +1,714 @@
+import base64
 import sqlite3
 import json
-from typing import List, Dict, Any, Optional
+import re
+import threading
+import logging
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from ..models.startup import Startup
+from .connection_pool import ConnectionPool, get_pool
+from .leases import LEASE_OWNER
+from .startup_cache import CachedStartup, StartupCache
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 5
+
+# stay well below SQLITE_MAX_VARIABLE_NUMBER in IN (...) lookups
+SQL_VARIABLE_CHUNK = 500
+
+# seq is an explicit rowid alias: the FTS index and list cursors key on it, and VACUUM may renumber implicit rowids
+STARTUPS_TABLE_SQL = '''
+CREATE TABLE IF NOT EXISTS {table} (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    website TEXT,
+    description TEXT,
+    founded_year TEXT,
+    headquarters TEXT,
+    employees_count INTEGER,
+    funding_total REAL,
+    data TEXT NOT NULL,
+    last_updated TEXT NOT NULL
+)
+'''
+
+STARTUP_COLUMNS = (
+    "id", "name", "website", "description", "founded_year", "headquarters",
+    "employees_count", "funding_total", "data", "last_updated"
+)
+
+# child tables holding the list fields of a startup, keyed by (startup_id, position)
+CHILD_TABLES = {
+    "startup_industries": "industry",
+    "startup_founders": "founder",
+    "startup_products": "product",
+}
+
+# bm25 column weights for startups_fts: startup_id, name, description, industry, products, founders, headquarters
+FTS_WEIGHTS = (0.0, 10.0, 1.0, 4.0, 2.0, 4.0, 2.0)
+
+FTS_SEARCH_SQL = f'''
+SELECT s.data, bm25(startups_fts, {", ".join(str(weight) for weight in FTS_WEIGHTS)}) AS score,
+       snippet(startups_fts, -1, '[', ']', '...', 12)
+FROM startups_fts
+JOIN startups s ON s.seq = startups_fts.rowid
+WHERE startups_fts MATCH ?
+ORDER BY score
+LIMIT ? OFFSET ?
+'''
+
+# Startup fields kept as JSON arrays/objects inside the data document
+STARTUP_FIELDS = tuple(Startup.model_fields)
+
+FTS_PHRASE = re.compile(r'"([^"]*)"')
+FTS_TOKEN = re.compile(r'\w+\*?')
+
+
+def fts_query(query: str, match_all: bool = True) -> str:
+    """Turn free text into an FTS5 query: quoted text stays a phrase, bare words become prefix terms."""
+    terms = []
+    for phrase in FTS_PHRASE.findall(query):
+        words = re.findall(r'\w+', phrase)
+        if words:
+            terms.append('"' + " ".join(words) + '"')
+    for token in FTS_TOKEN.findall(FTS_PHRASE.sub(" ", query)):
+        word = token.rstrip("*")
+        # very short words ("in", "ai") match exactly unless the caller asked for a prefix
+        prefix = token.endswith("*") or len(word) >= 3
+        terms.append('"' + word + '"' + ("*" if prefix else ""))
+    return (" " if match_all else " OR ").join(terms)
+
+
+def encode_cursor(seq: int) -> str:
+    return base64.urlsafe_b64encode(str(seq).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Inverse of encode_cursor; raises ValueError for anything it did not produce."""
+    try:
+        return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def funding_total(funding: Optional[Dict[str, Any]]) -> Optional[float]:
+    if not funding or not isinstance(funding, dict):
+        return None
+    return sum(
+        float(value) for value in funding.values()
+        if value and (isinstance(value, (int, float)) or
+                      (isinstance(value, str) and value.replace('.', '', 1).isdigit()))
+    )
+
+
+class WriteVersion:
+    """Reads the startup_writes counter, which every save_startups transaction bumps.
+
+    PRAGMA data_version on a connection of its own changes whenever any other
+    connection, in this process or another worker, commits to the file, and
+    costs no I/O; the counter is only read back after that.
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = sqlite3.connect(db_path, timeout=config.DB_BUSY_TIMEOUT, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._data_version = None
+        self._writes = 0.0
+
+    def __call__(self) -> float:
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                self._data_version = data_version
+                row = self._conn.execute("SELECT value FROM analytics_stats WHERE key = 'startup_writes'").fetchone()
+                self._writes = row[0] if row else 0.0
+            return self._writes
+
 
 class DatabaseService:
-    def __init__(self, db_path: str = "startups.db"):
+    # db_path -> whether FTS5 is available, recorded once schema setup has run
+    _initialized: Dict[str, bool] = {}
+    # db_path -> hot lookup cache, shared so a save through any instance invalidates it
+    _caches: Dict[str, StartupCache] = {}
+    _init_lock = threading.Lock()
+
+    def __init__(self, db_path: str = config.DATABASE_PATH):
         self.db_path = db_path
-        self._create_tables()
-    
-    def _create_tables(self):
-        conn = sqlite3.connect(self.db_path)
+        self.pool: ConnectionPool = get_pool(db_path)
+
+        with self._init_lock:
+            if db_path not in self._initialized:
+                with self.pool.connection() as conn:
+                    self._initialized[db_path] = self._create_tables(conn)
+            if db_path not in self._caches:
+                self._caches[db_path] = StartupCache(version=WriteVersion(db_path))
+            self.cache = self._caches[db_path]
+        self.fts_enabled = self._initialized[db_path]
+
+    def _create_tables(self, conn: sqlite3.Connection) -> bool:
         cursor = conn.cursor()
-        
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'startups'")
+        legacy = cursor.fetchone() is not None
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+
+        cursor.execute(STARTUPS_TABLE_SQL.format(table="startups"))
+
+        if legacy and version < 2:
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(startups)")}
+            for column, column_type in [
+                ("website", "TEXT"),
+                ("description", "TEXT"),
+                ("founded_year", "TEXT"),
+                ("headquarters", "TEXT"),
+                ("employees_count", "INTEGER"),
+                ("funding_total", "REAL"),
+            ]:
+                if column not in columns:
+                    cursor.execute(f"ALTER TABLE startups ADD COLUMN {column} {column_type}")
+
+        if legacy and version < 5:
+            self._add_seq_column(conn)
+
+        for table, column in CHILD_TABLES.items():
+            cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                startup_id TEXT NOT NULL REFERENCES startups(id) ON DELETE CASCADE,
+                position INTEGER NOT NULL,
+                {column} TEXT NOT NULL,
+                PRIMARY KEY (startup_id, position)
+            )
+            ''')
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column} COLLATE NOCASE)")
+
         cursor.execute('''
-        CREATE TABLE IF NOT EXISTS startups (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            data TEXT NOT NULL,
-            last_updated TEXT NOT NULL
+        CREATE TABLE IF NOT EXISTS startup_news (
+            startup_id TEXT NOT NULL REFERENCES startups(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            title TEXT,
+            url TEXT,
+            source TEXT,
+            date TEXT,
+            PRIMARY KEY (startup_id, position)
         )
         ''')
-        
+
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_startups_name ON startups (name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_startups_founded_year ON startups (founded_year)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_startups_headquarters ON startups (headquarters COLLATE NOCASE)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_startup_news_date ON startup_news (date)")
+
+        # aggregates maintained incrementally by _write_startups so analytics never scan
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS industry_counts (
+            industry TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        )
+        ''')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS analytics_stats (
+            key TEXT PRIMARY KEY,
+            value REAL NOT NULL
+        )
+        ''')
+
+        # research leases coordinate worker processes; see LeaseStore
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS research_leases (
+            startup_id TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+        ''')
+
+        self.fts_enabled = self._create_fts(cursor)
+
+        if legacy and version < 2:
+            self._migrate_rows(cursor)
+        elif legacy and version < 3 and self.fts_enabled:
+            self._rebuild_fts(cursor)
+
+        if version < 4:
+            self._rebuild_aggregates(cursor)
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
-        conn.close()
-    
-    def save_startup(self, startup: Startup) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        if not startup.id:
-            startup.id = startup.name.lower().replace(" ", "-")
-        
+        return self.fts_enabled
+
+    def _add_seq_column(self, conn: sqlite3.Connection):
+        """Rebuild a startups table keyed by id alone so that seq pins down each row's current rowid."""
+        if "seq" in {row[1] for row in conn.execute("PRAGMA table_info(startups)")}:
+            return
+
+        # dropping the old table must not cascade into the child tables; the pragma only applies outside a transaction
+        conn.commit()
+        conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            columns = ", ".join(STARTUP_COLUMNS)
+            conn.execute("DROP TABLE IF EXISTS startups_rebuild")
+            conn.execute(STARTUPS_TABLE_SQL.format(table="startups_rebuild"))
+            # copying rowid into seq keeps the existing FTS rowids and cursors valid
+            conn.execute(f"INSERT INTO startups_rebuild (seq, {columns}) SELECT rowid, {columns} FROM startups")
+            conn.execute("DROP TABLE startups")
+            conn.execute("ALTER TABLE startups_rebuild RENAME TO startups")
+            conn.commit()
+        finally:
+            conn.execute("PRAGMA foreign_keys = ON")
+        logger.info("Added seq column to the startups table")
+
+    def _create_fts(self, cursor: sqlite3.Cursor) -> bool:
         try:
-            cursor.execute(
-                "INSERT OR REPLACE INTO startups (id, name, data, last_updated) VALUES (?, ?, ?, ?)",
+            cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS startups_fts USING fts5(
+                startup_id UNINDEXED,
+                name,
+                description,
+                industry,
+                products,
+                founders,
+                headquarters,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '3'
+            )
+            ''')
+            return True
+        except sqlite3.OperationalError as e:
+            # sqlite built without FTS5; search falls back to LIKE scans
+            logger.warning("Full-text search unavailable: %s", e)
+            return False
+
+    def _rebuild_fts(self, cursor: sqlite3.Cursor):
+        cursor.execute("DELETE FROM startups_fts")
+        startups = []
+        for startup_id, data in cursor.execute("SELECT id, data FROM startups").fetchall():
+            startup = Startup.model_validate_json(data)
+            startup.id = startup_id
+            startups.append(startup)
+        self._write_fts(cursor, startups)
+
+    def _write_fts(self, cursor: sqlite3.Cursor, startups: List[Startup]):
+        # the index rowid is startups.seq so updates are keyed lookups, not scans
+        rowids = {}
+        ids = [startup.id for startup in startups]
+        for i in range(0, len(ids), SQL_VARIABLE_CHUNK):
+            chunk = ids[i:i + SQL_VARIABLE_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            rowids.update(
+                (startup_id, rowid) for rowid, startup_id in
+                cursor.execute(f"SELECT seq, id FROM startups WHERE id IN ({placeholders})", chunk)
+            )
+
+        cursor.executemany("DELETE FROM startups_fts WHERE rowid = ?", [(rowids[startup.id],) for startup in startups])
+        cursor.executemany(
+            "INSERT INTO startups_fts (rowid, startup_id, name, description, industry, products, founders, headquarters) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
                 (
+                    rowids[startup.id],
                     startup.id,
                     startup.name,
+                    startup.description or "",
+                    " ".join(startup.industry or []),
+                    " ".join(startup.products or []),
+                    " ".join(startup.founders or []),
+                    startup.headquarters or ""
+                )
+                for startup in startups
+            ]
+        )
+
+    def _rebuild_aggregates(self, cursor: sqlite3.Cursor):
+        cursor.execute("DELETE FROM industry_counts")
+        cursor.execute('''
+        INSERT INTO industry_counts (industry, count)
+        SELECT industry, COUNT(*) FROM startup_industries GROUP BY industry ORDER BY MIN(rowid)
+        ''')
+        # startup_writes is a change counter for cross-process cache invalidation, not an aggregate
+        cursor.execute("DELETE FROM analytics_stats WHERE key != 'startup_writes'")
+        cursor.execute('''
+        INSERT INTO analytics_stats (key, value)
+        SELECT 'startup_count', COUNT(*) FROM startups
+        UNION ALL SELECT 'funding_total', COALESCE(SUM(funding_total), 0) FROM startups
+        UNION ALL SELECT 'funding_count', COUNT(funding_total) FROM startups
+        ''')
+
+    def _update_aggregates(self, cursor: sqlite3.Cursor, startups: List[Startup]):
+        """Apply the delta between the stored and the incoming versions of startups to the aggregates."""
+        industry_delta: Dict[str, int] = {}
+        new_count = len(startups)
+        funding_delta = 0.0
+        funding_count_delta = 0
+
+        ids = [startup.id for startup in startups]
+        for i in range(0, len(ids), SQL_VARIABLE_CHUNK):
+            chunk = ids[i:i + SQL_VARIABLE_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+
+            for _, old_total in cursor.execute(
+                f"SELECT id, funding_total FROM startups WHERE id IN ({placeholders})", chunk
+            ).fetchall():
+                new_count -= 1
+                if old_total is not None:
+                    funding_delta -= old_total
+                    funding_count_delta -= 1
+
+            for industry, count in cursor.execute(
+                f"SELECT industry, COUNT(*) FROM startup_industries WHERE startup_id IN ({placeholders}) GROUP BY industry",
+                chunk
+            ).fetchall():
+                industry_delta[industry] = industry_delta.get(industry, 0) - count
+
+        for startup in startups:
+            total = funding_total(startup.funding)
+            if total is not None:
+                funding_delta += total
+                funding_count_delta += 1
+            for industry in startup.industry or []:
+                industry_delta[industry] = industry_delta.get(industry, 0) + 1
+
+        cursor.executemany(
+            "INSERT INTO industry_counts (industry, count) VALUES (?, ?) "
+            "ON CONFLICT(industry) DO UPDATE SET count = count + excluded.count",
+            [(industry, delta) for industry, delta in industry_delta.items() if delta]
+        )
+        cursor.execute("DELETE FROM industry_counts WHERE count <= 0")
+        cursor.executemany(
+            "INSERT INTO analytics_stats (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+            [
+                ("startup_count", new_count),
+                ("funding_total", funding_delta),
+                ("funding_count", funding_count_delta),
+                ("startup_writes", 1),
+            ]
+        )
+
+    def _migrate_rows(self, cursor: sqlite3.Cursor):
+        rows = []
+        for startup_id, data, last_updated in cursor.execute("SELECT id, data, last_updated FROM startups").fetchall():
+            startup = Startup.model_validate_json(data)
+            startup.id = startup_id
+            rows.append((startup, last_updated))
+        self._write_startups(cursor, rows)
+        logger.info("Migrated %s startups to schema version %s", len(rows), SCHEMA_VERSION)
+
+    def _write_startups(self, cursor: sqlite3.Cursor, rows: List[Tuple[Startup, str]]):
+        # a record repeated within one batch keeps only its last version
+        rows = list({startup.id: (startup, last_updated) for startup, last_updated in rows}.values())
+        startups = [startup for startup, _ in rows]
+
+        # must run before the upsert so it sees the previously stored versions
+        self._update_aggregates(cursor, startups)
+
+        cursor.executemany(
+            '''
+            INSERT INTO startups (
+                id, name, website, description, founded_year, headquarters,
+                employees_count, funding_total, data, last_updated
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name,
+                website = excluded.website,
+                description = excluded.description,
+                founded_year = excluded.founded_year,
+                headquarters = excluded.headquarters,
+                employees_count = excluded.employees_count,
+                funding_total = excluded.funding_total,
+                data = excluded.data,
+                last_updated = excluded.last_updated
+            ''',
+            [
+                (
+                    startup.id,
+                    startup.name,
+                    startup.website,
+                    startup.description,
+                    str(startup.founded_year) if startup.founded_year is not None else None,
+                    startup.headquarters,
+                    startup.employees_count,
+                    funding_total(startup.funding),
                     startup.model_dump_json(),
-                    datetime.now().isoformat()
+                    last_updated
                 )
+                for startup, last_updated in rows
+            ]
+        )
+
+        ids = [(startup.id,) for startup in startups]
+        for table in CHILD_TABLES:
+            cursor.executemany(f"DELETE FROM {table} WHERE startup_id = ?", ids)
+        cursor.executemany("DELETE FROM startup_news WHERE startup_id = ?", ids)
+
+        for table, field in [
+            ("startup_industries", "industry"),
+            ("startup_founders", "founders"),
+            ("startup_products", "products"),
+        ]:
+            cursor.executemany(
+                f"INSERT INTO {table} VALUES (?, ?, ?)",
+                [
+                    (startup.id, position, value)
+                    for startup in startups
+                    for position, value in enumerate(getattr(startup, field) or [])
+                ]
             )
-            conn.commit()
+
+        cursor.executemany(
+            "INSERT INTO startup_news VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (startup.id, position, item.get("title"), item.get("url"), item.get("source"), item.get("date"))
+                for startup in startups
+                for position, item in enumerate(startup.news or [])
+            ]
+        )
+
+        if self.fts_enabled:
+            self._write_fts(cursor, startups)
+
+        # our research leases end with the commit that makes the results visible
+        cursor.executemany(
+            "DELETE FROM research_leases WHERE startup_id = ? AND owner = ?",
+            [(startup.id, LEASE_OWNER) for startup in startups]
+        )
+
+    def save_startup(self, startup: Startup) -> bool:
+        return self.save_startups([startup])
+
+    def save_startups(self, startups: List[Startup]) -> bool:
+        """Upsert many startups in a single transaction (one commit, one fsync)."""
+        if not startups:
             return True
-        except Exception as e:
-            print(f"Error saving startup: {e}")
-            return False
-        finally:
-            conn.close()
-    
+
+        for startup in startups:
+            if not startup.id:
+                startup.id = startup.name.lower().replace(" ", "-")
+
+        last_updated = datetime.now().isoformat()
+        with self.pool.connection() as conn:
+            try:
+                # take the write lock up front so the aggregate deltas are read and applied atomically
+                conn.execute("BEGIN IMMEDIATE")
+                self._write_startups(conn.cursor(), [(startup, last_updated) for startup in startups])
+                version = conn.execute("SELECT value FROM analytics_stats WHERE key = 'startup_writes'").fetchone()[0]
+                conn.commit()
+                self.cache.invalidate(startups, version)
+                return True
+            except Exception as e:
+                conn.rollback()
+                logger.error("Error saving startups: %s", e)
+                return False
+
     def get_startup(self, startup_id: str) -> Optional[Startup]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT data FROM startups WHERE id = ? OR name = ?", (startup_id, startup_id))
-        result = cursor.fetchone()
-        
-        conn.close()
-        
-        if result:
-            return Startup.model_validate_json(result[0])
-        return None
-    
+        # cached instances are shared between callers and must not be modified
+        entry = self.get_startup_entry(startup_id)
+        return entry.startup if entry else None
+
+    def get_startup_entry(self, startup_id: str) -> Optional[CachedStartup]:
+        """The startup stored under this id (or name) with its serialized JSON and HTTP validators."""
+        entry = self.cache.get(startup_id)
+        if entry is not None:
+            return entry
+
+        generation = self.cache.generation
+        with self.pool.connection() as conn:
+            # two indexed lookups instead of an OR across id and name
+            result = conn.execute("SELECT data, last_updated FROM startups WHERE id = ?", (startup_id,)).fetchone()
+            if not result:
+                result = conn.execute("SELECT data, last_updated FROM startups WHERE name = ?", (startup_id,)).fetchone()
+
+        if not result:
+            return None
+        entry = CachedStartup(Startup.model_validate_json(result[0]), result[1])
+        self.cache.put(startup_id, entry, generation)
+        return entry
+
+    def get_startups(self, startup_ids: List[str]) -> Dict[str, Startup]:
+        """Stored startups for the given ids, keyed by id; missing ids are left out."""
+        results = {}
+        with self.pool.connection() as conn:
+            for i in range(0, len(startup_ids), SQL_VARIABLE_CHUNK):
+                chunk = startup_ids[i:i + SQL_VARIABLE_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                for startup_id, data in conn.execute(
+                    f"SELECT id, data FROM startups WHERE id IN ({placeholders})", chunk
+                ).fetchall():
+                    results[startup_id] = Startup.model_validate_json(data)
+        return results
+
     def get_all_startups(self) -> List[Startup]:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT data FROM startups")
-        results = cursor.fetchall()
-        
-        conn.close()
-        
+        with self.pool.connection() as conn:
+            results = conn.execute("SELECT data FROM startups").fetchall()
+
         return [Startup.model_validate_json(row[0]) for row in results]
-    
-    def search_startups(self, query: str) -> List[Startup]:
-        query = query.lower()
-        startups = self.get_all_startups()
-        
-        results = []
-        for startup in startups:
-            if any([
-                # nsame
-                query in startup.name.lower(),
-                
-                # description
-                startup.description and query in startup.description.lower(),
-                
-                # industry
-                startup.industry and any(query in industry.lower() for industry in startup.industry),
-                
-                # products
-                startup.products and any(query in product.lower() for product in startup.products),
-                
-                # founders
-                startup.founders and any(query in founder.lower() for founder in startup.founders),
-                
-                # headquarters
-                startup.headquarters and query in startup.headquarters.lower(),
-            ]):
-                results.append(startup)
-                
-        return results
-    
+
+    def list_startups(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        industry: Optional[str] = None,
+        founder: Optional[str] = None,
+        headquarters: Optional[str] = None,
+        founded_year: Optional[str] = None
+    ) -> Tuple[List[str], Optional[str]]:
+        """One page of startups as serialized JSON documents, plus the cursor of the next page.
+
+        Pages follow seq (keyset pagination), so deep pages cost the same as the
+        first. Without fields the stored documents are returned as-is; with fields
+        SQLite builds the projected documents itself, so no JSON is parsed in Python
+        and no Startup models are built either way.
+        """
+        where, params = [], []
+        if cursor:
+            where.append("s.seq > ?")
+            params.append(decode_cursor(cursor))
+        if industry:
+            where.append("EXISTS (SELECT 1 FROM startup_industries i WHERE i.startup_id = s.id AND i.industry = ? COLLATE NOCASE)")
+            params.append(industry)
+        if founder:
+            where.append("EXISTS (SELECT 1 FROM startup_founders f WHERE f.startup_id = s.id AND f.founder = ? COLLATE NOCASE)")
+            params.append(founder)
+        if headquarters:
+            where.append("s.headquarters LIKE ? ESCAPE '\\'")
+            params.append("%" + headquarters.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+        if founded_year:
+            where.append("s.founded_year = ?")
+            params.append(str(founded_year))
+
+        if fields:
+            # json_object keeps nested lists/objects as JSON because they come straight from json_extract
+            columns = "json_object(" + ", ".join(f"'{field}', json_extract(s.data, '$.{field}')" for field in fields) + ")"
+        else:
+            columns = "s.data"
+
+        sql = f"SELECT s.seq, {columns} FROM startups s"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY s.seq LIMIT ?"
+        params.append(limit + 1)
+
+        with self.pool.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        next_cursor = encode_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+        return [document for _, document in rows[:limit]], next_cursor
+
+    def get_field_map(self, column: str) -> Dict[str, Any]:
+        """Map startup name to a single column or list field, skipping empty values."""
+        if column == "founders":
+            with self.pool.connection() as conn:
+                rows = conn.execute('''
+                SELECT s.name, f.founder FROM startups s
+                JOIN startup_founders f ON f.startup_id = s.id
+                ORDER BY s.seq, f.position
+                ''').fetchall()
+            results = {}
+            for name, founder in rows:
+                results.setdefault(name, []).append(founder)
+            return results
+        elif column == "headquarters":
+            with self.pool.connection() as conn:
+                return dict(conn.execute(
+                    "SELECT name, headquarters FROM startups WHERE headquarters IS NOT NULL AND headquarters != ''"
+                ).fetchall())
+        raise ValueError(f"Unsupported field: {column}")
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        match_all: bool = True,
+        parse: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Ranked search returning {"startup", "score", "snippet"} dicts, best match first.
+
+        With parse=False "startup" is the stored JSON decoded into a plain dict, for
+        callers that only serialize it again.
+        """
+        if not self.fts_enabled:
+            return [
+                {"startup": startup if parse else startup.model_dump(mode="json"), "score": None, "snippet": None}
+                for startup in self._search_like(query, limit, offset)
+            ]
+
+        match = fts_query(query, match_all)
+        if not match:
+            return []
+
+        with self.pool.connection() as conn:
+            results = conn.execute(
+                FTS_SEARCH_SQL,
+                (match, limit if limit is not None else -1, offset)
+            ).fetchall()
+
+        decode = Startup.model_validate_json if parse else json.loads
+        return [
+            {"startup": decode(data), "score": -score, "snippet": snippet}
+            for data, score, snippet in results
+        ]
+
+    def search_startups(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        match_all: bool = True
+    ) -> List[Startup]:
+        return [result["startup"] for result in self.search(query, limit, offset, match_all)]
+
+    def _search_like(self, query: str, limit: Optional[int] = None, offset: int = 0) -> List[Startup]:
+        pattern = "%" + query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+        with self.pool.connection() as conn:
+            results = conn.execute(
+                '''
+                SELECT data FROM startups s
+                WHERE s.name LIKE :q ESCAPE '\\'
+                   OR s.description LIKE :q ESCAPE '\\'
+                   OR s.headquarters LIKE :q ESCAPE '\\'
+                   OR EXISTS (SELECT 1 FROM startup_industries i WHERE i.startup_id = s.id AND i.industry LIKE :q ESCAPE '\\')
+                   OR EXISTS (SELECT 1 FROM startup_products p WHERE p.startup_id = s.id AND p.product LIKE :q ESCAPE '\\')
+                   OR EXISTS (SELECT 1 FROM startup_founders f WHERE f.startup_id = s.id AND f.founder LIKE :q ESCAPE '\\')
+                LIMIT :limit OFFSET :offset
+                ''',
+                {"q": pattern, "limit": limit if limit is not None else -1, "offset": offset}
+            ).fetchall()
+
+        return [Startup.model_validate_json(row[0]) for row in results]
+
     def run_analytics(self, query_type: str) -> Dict[str, Any]:
-        startups = self.get_all_startups()
-        
-        if query_type == "industry_count":
-            industry_counts = {}
-            for startup in startups:
-                if startup.industry:
-                    for industry in startup.industry:
-                        industry_counts[industry] = industry_counts.get(industry, 0) + 1
-            return {"type": "industry_count", "data": industry_counts}
-        
-        elif query_type == "funding_stats":
-            total_funding = 0
-            valid_startups = 0
-            
-            for startup in startups:
-                if startup.funding and isinstance(startup.funding, dict):
-                    try:
-                        funding_sum = sum(
-                            float(value) for value in startup.funding.values() 
-                            if value and (isinstance(value, (int, float)) or 
-                                         (isinstance(value, str) and value.replace('.', '', 1).isdigit()))
-                        )
-                        total_funding += funding_sum
-                        valid_startups += 1
-                    except (ValueError, TypeError):
-                        pass
-            
+        with self.pool.connection() as conn:
+            if query_type == "industry_count":
+                rows = conn.execute("SELECT industry, count FROM industry_counts ORDER BY rowid").fetchall()
+                return {"type": "industry_count", "data": dict(rows)}
+
+            stats = dict(conn.execute("SELECT key, value FROM analytics_stats").fetchall())
+
+        if query_type == "funding_stats":
+            total_funding = stats.get("funding_total", 0.0)
+            valid_startups = int(stats.get("funding_count", 0))
+
             avg_funding = total_funding / valid_startups if valid_startups else 0
             return {
-                "type": "funding_stats", 
+                "type": "funding_stats",
                 "data": {"total": total_funding, "average": avg_funding}
             }
-        
+
         return {
             "type": "startup_count",
-            "data": {"total": len(startups)}
-        }
\ No newline at end of file
+            "data": {"total": int(stats.get("startup_count", 0))}
+        }
+
+_db_service: Optional[DatabaseService] = None
+
+
+def get_database_service() -> DatabaseService:
+    global _db_service
+    if _db_service is None:
+        _db_service = DatabaseService()
+    return _db_service
@@ -0,0 +1,157 @@
+import json
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+# words and single punctuation marks; whitespace only separates tokens, so
+# keyword matches always start and end on word boundaries
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+REGEX_FLAGS = {"i": re.I, "m": re.M, "s": re.S}
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over word tokens.
+
+    Finds every keyword in a single pass over the text, so matching cost depends
+    on the text length, not on how many keywords the taxonomy holds.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = keywords
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for index, keyword in enumerate(keywords):
+            node = 0
+            for token in tokenize(keyword):
+                next_node = self._goto[node].get(token)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][token] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                node = next_node
+            if node:
+                self._output[node] += (index,)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] += self._output[self._fail[child]]
+
+    def find(self, text: str) -> List[int]:
+        """Return the indexes of all keywords present in text, in keyword order."""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set()
+        node = 0
+        for token in tokenize(text):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            if output[node]:
+                found.update(output[node])
+        return sorted(found)
+
+
+class FieldRule:
+    def __init__(self, field: str, rule: Dict[str, Any]):
+        self.field = field
+        flags = 0
+        for flag in rule.get("flags", ""):
+            flags |= REGEX_FLAGS[flag]
+        self.pattern = re.compile(rule["pattern"], flags)
+        self.split = re.compile(rule["split"]) if rule.get("split") else None
+        self.strip = rule.get("strip", False)
+        self.type = rule.get("type")
+
+    def apply(self, text: str, result: Dict[str, Any]) -> Any:
+        """Store the matched value in result and return it, or None when the pattern is absent."""
+        match = self.pattern.search(text)
+        if not match:
+            return None
+
+        value: Any = match.group(1)
+        if self.split:
+            value = [part.strip() for part in self.split.split(value) if part.strip()]
+        elif self.strip:
+            value = value.strip()
+        if self.type == "int":
+            value = int(value)
+
+        # "funding.Revenue" writes into the nested funding dict
+        target = result
+        *parents, key = self.field.split(".")
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[key] = value
+        return value
+
+
+class WikipediaExtractor:
+    """Precompiled extraction rules for Wikipedia intro extracts and infobox wikitext."""
+
+    def __init__(self, rules: Dict[str, Any]):
+        industries = rules.get("industries", [])
+        self.industry_labels = [entry.get("label") or entry["term"].capitalize() for entry in industries]
+        self.industry_matcher = KeywordMatcher([entry["term"] for entry in industries])
+        self.text_rules = [FieldRule(field, rule) for field, rule in rules.get("text_fields", {}).items()]
+        self.infobox_rules = [FieldRule(field, rule) for field, rule in rules.get("infobox_fields", {}).items()]
+
+    @classmethod
+    def from_file(cls, path: str) -> "WikipediaExtractor":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def find_industries(self, text: str) -> List[str]:
+        labels = []
+        for index in self.industry_matcher.find(text):
+            label = self.industry_labels[index]
+            if label not in labels:
+                labels.append(label)
+        return labels
+
+    def _apply_rules(self, rules: List[FieldRule], text: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        found = {}
+        for rule in rules:
+            value = rule.apply(text, result)
+            if value is not None:
+                found[rule.field] = value
+        return found
+
+    def extract_text(self, text: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill result from an intro extract; returns the fields found and their values."""
+        found = self._apply_rules(self.text_rules, text, result)
+        industries = self.find_industries(text)
+        if industries:
+            result["industry"] = industries
+            found["industry"] = industries
+        return found
+
+    def extract_infobox(self, wikitext: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        return self._apply_rules(self.infobox_rules, wikitext, result)
+
+
+@lru_cache(maxsize=None)
+def get_extractor(path: Optional[str] = None) -> WikipediaExtractor:
+    return WikipediaExtractor.from_file(path or config.EXTRACTION_RULES_PATH)
@@ -0,0 +1,215 @@
+import asyncio
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Optional
+import logging
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+SOCIAL_PATTERNS = {
+    'twitter': re.compile(r'twitter\.com|x\.com'),
+    'linkedin': re.compile(r'linkedin\.com'),
+    'facebook': re.compile(r'facebook\.com'),
+    'instagram': re.compile(r'instagram\.com'),
+}
+
+PRODUCT_SECTION_CLASS = re.compile(r'product|solutions|offering', re.I)
+
+# cheap byte-level markers used while a page is still streaming in
+HEAD_END = re.compile(rb'</head\s*>|<body[\s>]', re.I)
+LINK_START = re.compile(rb'<a\s[^>]*?href', re.I)
+SCAN_OVERLAP = 256
+
+
+def _class_matches(value) -> bool:
+    if not value:
+        return False
+    classes = value.split() if isinstance(value, str) else list(value)
+    # same rule bs4 applies to class_=regex: any single class or the joined value
+    return any(PRODUCT_SECTION_CLASS.search(c) for c in classes) or bool(PRODUCT_SECTION_CLASS.search(" ".join(classes)))
+
+
+def _wanted_tag(name: str, attrs: Dict[str, Any]) -> bool:
+    if name in ('meta', 'a'):
+        return True
+    return name in ('section', 'div') and _class_matches(attrs.get('class'))
+
+
+# only build the nodes we read: meta tags, anchors and product sections (with their subtrees)
+PARTIAL_PARSE = SoupStrainer(_wanted_tag)
+
+
+def resolve_backend(backend: str = config.HTML_PARSER_BACKEND) -> str:
+    if backend == "auto":
+        return "lxml" if HAS_LXML else "html.parser"
+    if backend == "selectolax" and SelectolaxParser is None:
+        logger.warning("selectolax is not installed, falling back to html.parser")
+        return "html.parser"
+    if backend == "lxml" and not HAS_LXML:
+        logger.warning("lxml is not installed, falling back to html.parser")
+        return "html.parser"
+    return backend
+
+
+def is_html_content_type(content_type: Optional[str]) -> bool:
+    # servers that omit the header usually serve HTML; anything declared otherwise is skipped
+    if not content_type:
+        return True
+    mime = content_type.split(";", 1)[0].strip().lower()
+    return mime in config.WEBSITE_CONTENT_TYPES
+
+
+class PageScanner:
+    """Watches a page as it streams in and reports when enough has been read.
+
+    Reading can stop once the <head> metadata is complete and max_links anchors
+    have been seen; the partial body is then handed to parse_company_html.
+    """
+
+    def __init__(self, max_links: int = config.WEBSITE_MAX_LINKS):
+        self.max_links = max_links
+        self.head_done = False
+        self.links = 0
+        self._pos = 0
+
+    def feed(self, buffer: bytes) -> bool:
+        """Scan the newly received tail of buffer; returns True when reading can stop."""
+        start = self._pos
+        if not self.head_done:
+            if HEAD_END.search(buffer, start):
+                self.head_done = True
+        last_end = start
+        for match in LINK_START.finditer(buffer, start):
+            self.links += 1
+            last_end = match.end()
+        # rescan a short tail so a tag split across chunks is still counted, never twice
+        self._pos = max(last_end, len(buffer) - SCAN_OVERLAP, start)
+        return self.head_done and self.links >= self.max_links
+
+
+def _add_product(result: Dict[str, Any], text: str):
+    text = text.strip()
+    if text and len(text) < 50:
+        result["products"].append(text)
+
+
+def _parse_with_soup(html: str, features: str, result: Dict[str, Any]):
+    soup = BeautifulSoup(html, features, parse_only=PARTIAL_PARSE)
+
+    meta_desc = soup.find('meta', {'name': 'description'})
+    if meta_desc:
+        result["description"] = meta_desc.get('content')
+
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        for platform, pattern in SOCIAL_PATTERNS.items():
+            if pattern.search(href):
+                result["social_media"][platform] = href
+                break
+
+    for section in soup.find_all(['section', 'div'], class_=PRODUCT_SECTION_CLASS):
+        for product in section.find_all(['h2', 'h3', 'h4']):
+            _add_product(result, product.text)
+
+
+def _parse_with_selectolax(html: str, result: Dict[str, Any]):
+    tree = SelectolaxParser(html)
+
+    meta_desc = tree.css_first('meta[name="description"]')
+    if meta_desc:
+        result["description"] = meta_desc.attributes.get('content')
+
+    for link in tree.css('a[href]'):
+        href = link.attributes.get('href') or ''
+        for platform, pattern in SOCIAL_PATTERNS.items():
+            if pattern.search(href):
+                result["social_media"][platform] = href
+                break
+
+    for section in tree.css('section[class], div[class]'):
+        if _class_matches(section.attributes.get('class')):
+            for product in section.css('h2, h3, h4'):
+                _add_product(result, product.text())
+
+
+def parse_company_html(body: bytes, charset: str = "utf-8", backend: str = "html.parser") -> Dict[str, Any]:
+    """Decode and parse a homepage. Module-level so it can run in a process pool."""
+    try:
+        html = body.decode(charset, errors="replace")
+    except LookupError:
+        html = body.decode("utf-8", errors="replace")
+
+    result = {"description": None, "products": [], "social_media": {}}
+    if backend == "selectolax" and SelectolaxParser is not None:
+        _parse_with_selectolax(html, result)
+    else:
+        _parse_with_soup(html, backend if backend != "selectolax" else "html.parser", result)
+    return result
+
+
+class HtmlParserPool:
+    """Runs CPU-bound HTML parsing in a thread or process pool instead of on the event loop."""
+
+    def __init__(
+        self,
+        kind: str = config.HTML_PARSER_POOL,
+        max_workers: int = config.HTML_PARSER_WORKERS,
+        backend: str = config.HTML_PARSER_BACKEND
+    ):
+        self.kind = kind
+        self.max_workers = max_workers
+        self.backend = resolve_backend(backend)
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="html")
+        return self._executor
+
+    async def parse(self, body: bytes, charset: str = "utf-8") -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse_company_html, body, charset, self.backend)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+_parser_pool: Optional[HtmlParserPool] = None
+
+
+def get_parser_pool() -> HtmlParserPool:
+    global _parser_pool
+    if _parser_pool is None:
+        _parser_pool = HtmlParserPool()
+    return _parser_pool
+
+
+def close_parser_pool():
+    global _parser_pool
+    if _parser_pool is not None:
+        _parser_pool.close()
+        _parser_pool = None
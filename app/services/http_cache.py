@@ -0,0 +1,220 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import logging
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse:
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        body: bytes,
+        content_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        expires_at: float = 0.0,
+        from_cache: bool = False
+    ):
+        self.url = url
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.from_cache = from_cache
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def charset(self) -> str:
+        if self.content_type and "charset=" in self.content_type:
+            return self.content_type.split("charset=", 1)[1].split(";")[0].strip()
+        return "utf-8"
+
+    def text(self) -> str:
+        try:
+            return self.body.decode(self.charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class ResponseCache:
+    """SQLite-backed HTTP response cache keyed by URL with per-host TTLs and LRU eviction.
+
+    Hits only note their access time in memory; those are written back in one
+    batch every access_flush_interval seconds and before eviction, so reads do
+    not turn into commits.
+    """
+
+    def __init__(
+        self,
+        db_path: str = config.HTTP_CACHE_PATH,
+        max_bytes: int = config.HTTP_CACHE_MAX_BYTES,
+        ttls: Optional[Dict[str, int]] = None,
+        default_ttl: int = config.HTTP_CACHE_DEFAULT_TTL,
+        access_flush_interval: float = config.HTTP_CACHE_ACCESS_FLUSH_INTERVAL
+    ):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttls = ttls if ttls is not None else dict(config.HTTP_CACHE_TTLS)
+        self.default_ttl = default_ttl
+        self.access_flush_interval = access_flush_interval
+        # url -> last access time not yet written to http_cache
+        self._accessed: Dict[str, float] = {}
+        self._accessed_flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._create_tables()
+        self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+
+    def _create_tables(self):
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                body BLOB NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            ''')
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_last_access ON http_cache (last_access)")
+            # entries written before credentials were kept out of the key
+            self._conn.execute("DELETE FROM http_cache WHERE url LIKE '%api_key=%'")
+            self._conn.commit()
+
+    def ttl_for(self, url: str) -> int:
+        return self.ttls.get(urlparse(url).hostname or "", self.default_ttl)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, body, content_type, etag, last_modified, expires_at FROM http_cache WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if not row:
+                return None
+            self._accessed[url] = time.time()
+            if time.monotonic() - self._accessed_flushed_at >= self.access_flush_interval:
+                self._write_accessed()
+                self._conn.commit()
+
+        status, body, content_type, etag, last_modified, expires_at = row
+        return CachedResponse(url, status, body, content_type, etag, last_modified, expires_at, from_cache=True)
+
+    def put(self, response: CachedResponse):
+        now = time.time()
+        response.expires_at = now + self.ttl_for(response.url)
+        size = len(response.body)
+
+        with self._lock:
+            self._accessed.pop(response.url, None)
+            old = self._conn.execute("SELECT size FROM http_cache WHERE url = ?", (response.url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(url, status, body, content_type, etag, last_modified, fetched_at, expires_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    response.url,
+                    response.status,
+                    response.body,
+                    response.content_type,
+                    response.etag,
+                    response.last_modified,
+                    now,
+                    response.expires_at,
+                    now,
+                    size
+                )
+            )
+            self.total_bytes += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, response: CachedResponse):
+        """Extend a cached entry after the origin answered 304 Not Modified."""
+        now = time.time()
+        response.expires_at = now + self.ttl_for(response.url)
+        with self._lock:
+            self._accessed.pop(response.url, None)
+            self._conn.execute(
+                "UPDATE http_cache SET expires_at = ?, last_access = ? WHERE url = ?",
+                (response.expires_at, now, response.url)
+            )
+            self._conn.commit()
+
+    def _write_accessed(self):
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE http_cache SET last_access = ? WHERE url = ?",
+                [(accessed_at, url) for url, accessed_at in self._accessed.items()]
+            )
+            self._accessed.clear()
+        self._accessed_flushed_at = time.monotonic()
+
+    def _evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        # least recently used has to see the hits not written back yet
+        self._write_accessed()
+        cursor = self._conn.execute("SELECT url, size FROM http_cache ORDER BY last_access")
+        evicted = []
+        for url, size in cursor:
+            if self.total_bytes <= self.max_bytes:
+                break
+            evicted.append((url,))
+            self.total_bytes -= size
+
+        self._conn.executemany("DELETE FROM http_cache WHERE url = ?", evicted)
+        logger.info("Evicted %s cached responses", len(evicted))
+
+    def clear(self):
+        with self._lock:
+            self._accessed.clear()
+            self._conn.execute("DELETE FROM http_cache")
+            self._conn.commit()
+            self.total_bytes = 0
+
+    def close(self):
+        with self._lock:
+            self._write_accessed()
+            self._conn.commit()
+            self._conn.close()
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    global _response_cache
+    if _response_cache is None and config.HTTP_CACHE_ENABLED:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
+def close_response_cache():
+    global _response_cache
+    if _response_cache is not None:
+        _response_cache.close()
+        _response_cache = None
@@ -0,0 +1,78 @@
+import aiohttp
+import asyncio
+from typing import Optional
+import logging
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClient:
+    """App-lifetime aiohttp session shared by every scraper.
+
+    Started and stopped once (FastAPI lifespan, reset_db.py, batch jobs) so
+    connections, TLS sessions and DNS lookups are reused across companies.
+    """
+
+    def __init__(
+        self,
+        limit: int = config.HTTP_POOL_LIMIT,
+        limit_per_host: int = config.HTTP_POOL_LIMIT_PER_HOST,
+        dns_cache_ttl: int = config.HTTP_DNS_CACHE_TTL,
+        keepalive_timeout: float = config.HTTP_KEEPALIVE_TIMEOUT,
+        timeout: float = config.HTTP_TIMEOUT,
+        connect_timeout: float = config.HTTP_CONNECT_TIMEOUT,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    async def start(self) -> aiohttp.ClientSession:
+        async with self._lock:
+            if not self.started:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=self.timeout,
+                    headers={"User-Agent": config.HTTP_USER_AGENT},
+                )
+                logger.info("Started HTTP pool (limit=%s, per_host=%s)", self.limit, self.limit_per_host)
+            return self._session
+
+    async def close(self):
+        async with self._lock:
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+                logger.info("Closed HTTP pool")
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if not self.started:
+            raise RuntimeError("HTTP client is not started")
+        return self._session
+
+
+_http_client: Optional[HttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClient()
+    return _http_client
@@ -0,0 +1,185 @@
+import asyncio
+import time
+from typing import List, Dict, Any, Optional, Set, Tuple
+import logging
+
+from .job_store import JobItem, JobStore
+from .async_database import AsyncDatabaseService, get_async_database_service
+from .research_service import ResearchService
+from .startup_writer import get_startup_writer
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchJobQueue:
+    """Runs persisted research jobs in the background.
+
+    A dispatcher claims batches of pending companies from the JobStore and
+    researches each batch with ResearchService.iter_research, so batches still
+    share Wikipedia lookups. Outcomes are recorded once the batch's startups are
+    flushed, which makes a crash at worst repeat a batch, never lose one.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        db_service: AsyncDatabaseService,
+        research_service: ResearchService,
+        workers: int = config.JOB_WORKERS,
+        batch_size: int = config.JOB_BATCH_SIZE
+    ):
+        self.store = store
+        self.db_service = db_service
+        self.research_service = research_service
+        self.workers = workers
+        self.batch_size = batch_size
+        self._wakeup = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    async def start(self):
+        if self._dispatcher is not None:
+            return
+        # only items whose worker stopped sending heartbeats are taken over; live workers keep theirs
+        resumed = await self.db_service.run(self.store.release_stale)
+        if resumed:
+            logger.info("Resuming %s research job items abandoned by a stopped worker", resumed)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        self._heartbeat = asyncio.create_task(self._send_heartbeats())
+
+    async def stop(self):
+        if self._dispatcher is None:
+            return
+        self._dispatcher.cancel()
+        self._heartbeat.cancel()
+        for batch in list(self._batches):
+            batch.cancel()
+        await asyncio.gather(self._dispatcher, self._heartbeat, *self._batches, return_exceptions=True)
+        self._dispatcher = None
+        self._heartbeat = None
+        # this worker's unfinished items go back to the queue; other workers' items are left alone
+        await self.db_service.run(self.store.release)
+
+    async def submit(
+        self,
+        company_names: List[str],
+        priority: int = config.PRIORITY_BULK,
+        bypass_cache: bool = False,
+        force: bool = False
+    ) -> str:
+        job_id = await self.db_service.run(self.store.create_job, company_names, priority, bypass_cache, force)
+        logger.info("Queued research job %s with %s startups", job_id, len(company_names))
+        self._wakeup.set()
+        return job_id
+
+    async def get_job(self, job_id: str, limit: Optional[int] = None, offset: int = 0, include_results: bool = False) -> Optional[Dict[str, Any]]:
+        return await self.db_service.run(self.store.get_job, job_id, limit, offset, include_results)
+
+    async def _dispatch(self):
+        while True:
+            items = []
+            if len(self._batches) < self.workers:
+                try:
+                    items = await self.db_service.run(self.store.claim, self.batch_size)
+                except Exception as e:
+                    logger.error("Error claiming research job items: %s", e)
+
+            if items:
+                batch = asyncio.create_task(self._run_batch(items))
+                self._batches.add(batch)
+                batch.add_done_callback(self._batch_done)
+                continue
+
+            # idle (or at capacity): sleep until a submit, a finished batch or the next retry is due
+            timeout = config.JOB_POLL_INTERVAL
+            if len(self._batches) < self.workers:
+                next_due = await self.db_service.run(self.store.next_due)
+                if next_due is not None:
+                    timeout = min(timeout, max(next_due - time.time(), 0.05))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _send_heartbeats(self):
+        while True:
+            await asyncio.sleep(config.JOB_HEARTBEAT_INTERVAL)
+            try:
+                await self.db_service.run(self.store.heartbeat)
+                released = await self.db_service.run(self.store.release_stale)
+            except Exception as e:
+                logger.error("Error sending research job heartbeat: %s", e)
+                continue
+            if released:
+                logger.info("Requeued %s research job items abandoned by a stopped worker", released)
+                self._wakeup.set()
+
+    def _batch_done(self, batch: asyncio.Task):
+        self._batches.discard(batch)
+        self._wakeup.set()
+
+    async def _run_batch(self, items: List[JobItem]):
+        groups: Dict[Tuple[int, bool, bool], List[JobItem]] = {}
+        for item in items:
+            groups.setdefault((item.priority, item.bypass_cache, item.force), []).append(item)
+
+        outcomes = []
+        for (priority, bypass_cache, force), group in groups.items():
+            outcomes.extend(await self._research_group(group, priority, bypass_cache, force))
+
+        try:
+            await self.db_service.run(self.store.finish, outcomes)
+        except Exception as e:
+            logger.error("Error recording research job results: %s", e)
+            await self.db_service.run(self.store.release, items)
+
+    async def _research_group(
+        self,
+        items: List[JobItem],
+        priority: int,
+        bypass_cache: bool,
+        force: bool
+    ) -> List[Tuple[JobItem, Optional[str], Optional[str]]]:
+        results: Dict[int, Tuple[JobItem, Optional[str], Optional[str]]] = {}
+        try:
+            # iter_research flushes the writer before it finishes, so "done" is only recorded for saved startups
+            async for index, startup in self.research_service.iter_research(
+                [item.company_name for item in items],
+                priority=priority,
+                bypass_cache=bypass_cache,
+                force=force
+            ):
+                item = items[index]
+                if startup.id is None:
+                    results[index] = (item, None, "research failed")
+                else:
+                    results[index] = (item, startup.id, None)
+        except Exception as e:
+            logger.error("Error running research job batch: %s", e)
+            return [(item, None, str(e) or type(e).__name__) for item in items]
+        return [results.get(index, (item, None, "research did not complete")) for index, item in enumerate(items)]
+
+
+_job_queue: Optional[ResearchJobQueue] = None
+
+
+def get_job_queue() -> ResearchJobQueue:
+    global _job_queue
+    if _job_queue is None:
+        db_service = get_async_database_service()
+        _job_queue = ResearchJobQueue(
+            JobStore(db_service.db.db_path),
+            db_service,
+            ResearchService(db_service, writer=get_startup_writer())
+        )
+    return _job_queue
+
+
+async def close_job_queue():
+    global _job_queue
+    if _job_queue is not None:
+        await _job_queue.stop()
+        _job_queue = None
@@ -0,0 +1,315 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
+import logging
+
+from .connection_pool import ConnectionPool, get_pool
+from .leases import LEASE_OWNER
+from .metrics import RETRIES
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+JOB_ITEM_STATUSES = ("pending", "running", "done", "failed")
+
+
+class JobItem:
+    def __init__(
+        self,
+        job_id: str,
+        position: int,
+        company_name: str,
+        attempts: int,
+        priority: int,
+        bypass_cache: bool,
+        force: bool = False
+    ):
+        self.job_id = job_id
+        self.position = position
+        self.company_name = company_name
+        self.attempts = attempts
+        self.priority = priority
+        self.bypass_cache = bypass_cache
+        self.force = force
+
+
+class JobStore:
+    """SQLite-persisted research job queue living next to the startups tables.
+
+    Every company in a job is a row in research_job_items; workers claim pending
+    rows under their owner id and keep touching updated_at while they run them.
+    Running rows whose heartbeat has gone stale, e.g. after a crash, are put
+    back to "pending" for any worker to pick up.
+    """
+
+    _initialized = set()
+    _init_lock = threading.Lock()
+
+    def __init__(self, db_path: str = config.DATABASE_PATH, owner: str = LEASE_OWNER):
+        self.db_path = db_path
+        self.owner = owner
+        self.pool: ConnectionPool = get_pool(db_path)
+
+        with self._init_lock:
+            if db_path not in self._initialized:
+                with self.pool.connection() as conn:
+                    self._create_tables(conn)
+                self._initialized.add(db_path)
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        cursor = conn.cursor()
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS research_jobs (
+            id TEXT PRIMARY KEY,
+            priority INTEGER NOT NULL,
+            bypass_cache INTEGER NOT NULL,
+            force INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            finished_at REAL
+        )
+        ''')
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS research_job_items (
+            job_id TEXT NOT NULL REFERENCES research_jobs(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            company_name TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL DEFAULT 0,
+            startup_id TEXT,
+            error TEXT,
+            updated_at REAL NOT NULL,
+            owner TEXT,
+            PRIMARY KEY (job_id, position)
+        )
+        ''')
+        if "force" not in {row[1] for row in cursor.execute("PRAGMA table_info(research_jobs)")}:
+            cursor.execute("ALTER TABLE research_jobs ADD COLUMN force INTEGER NOT NULL DEFAULT 0")
+        if "owner" not in {row[1] for row in cursor.execute("PRAGMA table_info(research_job_items)")}:
+            cursor.execute("ALTER TABLE research_job_items ADD COLUMN owner TEXT")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_research_job_items_status "
+            "ON research_job_items (status, next_attempt_at)"
+        )
+        conn.commit()
+
+    def create_job(self, company_names: List[str], priority: int, bypass_cache: bool = False, force: bool = False) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT INTO research_jobs (id, priority, bypass_cache, force, total, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, priority, int(bypass_cache), int(force), len(company_names), now)
+            )
+            conn.executemany(
+                "INSERT INTO research_job_items (job_id, position, company_name, updated_at) VALUES (?, ?, ?, ?)",
+                [(job_id, position, name, now) for position, name in enumerate(company_names)]
+            )
+            conn.commit()
+        return job_id
+
+    def claim(self, limit: int) -> List[JobItem]:
+        """Mark up to limit due items as running and return them, highest priority job first."""
+        now = time.time()
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                '''
+                SELECT i.job_id, i.position, i.company_name, i.attempts, j.priority, j.bypass_cache, j.force
+                FROM research_job_items i
+                JOIN research_jobs j ON j.id = i.job_id
+                WHERE i.status = 'pending' AND i.next_attempt_at <= ?
+                ORDER BY j.priority, j.created_at, i.position
+                LIMIT ?
+                ''',
+                (now, limit)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE research_job_items SET status = 'running', owner = ?, updated_at = ? WHERE job_id = ? AND position = ?",
+                [(self.owner, now, job_id, position) for job_id, position, *_ in rows]
+            )
+            conn.commit()
+        return [
+            JobItem(job_id, position, name, attempts, priority, bool(bypass_cache), bool(force))
+            for job_id, position, name, attempts, priority, bypass_cache, force in rows
+        ]
+
+    def next_due(self) -> Optional[float]:
+        """Earliest time a pending item becomes claimable, or None when nothing is pending."""
+        with self.pool.connection() as conn:
+            return conn.execute(
+                "SELECT MIN(next_attempt_at) FROM research_job_items WHERE status = 'pending'"
+            ).fetchone()[0]
+
+    def finish(self, outcomes: List[Tuple[JobItem, Optional[str], Optional[str]]]):
+        """Record (item, startup_id, error) outcomes; failed items are retried with backoff."""
+        if not outcomes:
+            return
+
+        now = time.time()
+        done, retry, failed = [], [], []
+        for item, startup_id, error in outcomes:
+            attempts = item.attempts + 1
+            if error is None:
+                done.append((attempts, startup_id, now, item.job_id, item.position))
+            elif attempts < config.JOB_MAX_ATTEMPTS:
+                retry_at = now + config.JOB_RETRY_BACKOFF * 2 ** (attempts - 1)
+                retry.append((attempts, retry_at, error, now, item.job_id, item.position))
+            else:
+                failed.append((attempts, error, now, item.job_id, item.position))
+
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                '''
+                UPDATE research_job_items
+                SET status = 'done', attempts = ?, startup_id = ?, error = NULL, updated_at = ?
+                WHERE job_id = ? AND position = ?
+                ''',
+                done
+            )
+            conn.executemany(
+                '''
+                UPDATE research_job_items
+                SET status = 'pending', owner = NULL, attempts = ?, next_attempt_at = ?, error = ?, updated_at = ?
+                WHERE job_id = ? AND position = ?
+                ''',
+                retry
+            )
+            conn.executemany(
+                '''
+                UPDATE research_job_items
+                SET status = 'failed', attempts = ?, error = ?, updated_at = ?
+                WHERE job_id = ? AND position = ?
+                ''',
+                failed
+            )
+            # a job is finished once none of its items can run again
+            conn.executemany(
+                '''
+                UPDATE research_jobs SET finished_at = ?
+                WHERE id = ? AND finished_at IS NULL AND NOT EXISTS (
+                    SELECT 1 FROM research_job_items
+                    WHERE job_id = ? AND status IN ('pending', 'running')
+                )
+                ''',
+                [(now, job_id, job_id) for job_id in {item.job_id for item, _, _ in outcomes}]
+            )
+            conn.commit()
+        if retry:
+            RETRIES.inc(len(retry), kind="job_item")
+
+    def heartbeat(self) -> int:
+        """Mark this worker's running items as still in progress."""
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "UPDATE research_job_items SET updated_at = ? WHERE status = 'running' AND owner = ?",
+                (time.time(), self.owner)
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def release(self, items: Optional[List[JobItem]] = None) -> int:
+        """Put this worker's running items back to pending: the given ones, or all of them."""
+        now = time.time()
+        with self.pool.connection() as conn:
+            if items is None:
+                cursor = conn.execute(
+                    "UPDATE research_job_items SET status = 'pending', owner = NULL, updated_at = ? "
+                    "WHERE status = 'running' AND owner = ?",
+                    (now, self.owner)
+                )
+                count = cursor.rowcount
+            else:
+                conn.executemany(
+                    '''
+                    UPDATE research_job_items SET status = 'pending', owner = NULL, updated_at = ?
+                    WHERE job_id = ? AND position = ? AND status = 'running' AND owner = ?
+                    ''',
+                    [(now, item.job_id, item.position, self.owner) for item in items]
+                )
+                count = len(items)
+            conn.commit()
+        return count
+
+    def release_stale(self, timeout: float = config.JOB_HEARTBEAT_TIMEOUT) -> int:
+        """Put running items of any worker back to pending when their heartbeat is older than timeout."""
+        now = time.time()
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "UPDATE research_job_items SET status = 'pending', owner = NULL, updated_at = ? "
+                "WHERE status = 'running' AND updated_at < ?",
+                (now, now - timeout)
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Items per status across all jobs."""
+        with self.pool.connection() as conn:
+            return dict(conn.execute(
+                "SELECT status, COUNT(*) FROM research_job_items GROUP BY status"
+            ).fetchall())
+
+    def get_job(self, job_id: str, limit: Optional[int] = None, offset: int = 0, include_results: bool = False) -> Optional[Dict[str, Any]]:
+        with self.pool.connection() as conn:
+            job = conn.execute(
+                "SELECT id, priority, bypass_cache, force, total, created_at, finished_at FROM research_jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+            if not job:
+                return None
+
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM research_job_items WHERE job_id = ? GROUP BY status",
+                (job_id,)
+            ).fetchall())
+            items = conn.execute(
+                '''
+                SELECT i.position, i.company_name, i.status, i.attempts, i.error, i.startup_id, s.data
+                FROM research_job_items i
+                LEFT JOIN startups s ON s.id = i.startup_id
+                WHERE i.job_id = ?
+                ORDER BY i.position
+                LIMIT ? OFFSET ?
+                ''',
+                (job_id, limit if limit is not None else -1, offset)
+            ).fetchall()
+
+        job_id, priority, bypass_cache, force, total, created_at, finished_at = job
+        progress = {status: counts.get(status, 0) for status in JOB_ITEM_STATUSES}
+        if finished_at is not None:
+            status = "completed"
+        elif progress["running"] or progress["done"] or progress["failed"]:
+            status = "running"
+        else:
+            status = "queued"
+
+        return {
+            "id": job_id,
+            "status": status,
+            "priority": priority,
+            "bypass_cache": bool(bypass_cache),
+            "force": bool(force),
+            "total": total,
+            "progress": progress,
+            "created_at": created_at,
+            "finished_at": finished_at,
+            "items": [
+                {
+                    "position": position,
+                    "name": name,
+                    "status": item_status,
+                    "attempts": attempts,
+                    "error": error,
+                    "startup_id": startup_id,
+                    # stored startups are already valid Startup JSON; decode without re-validating
+                    **({"startup": json.loads(data)} if include_results and data else {})
+                }
+                for position, name, item_status, attempts, error, startup_id, data in items
+            ]
+        }
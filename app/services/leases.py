@@ -0,0 +1,59 @@
+import os
+import socket
+import time
+import uuid
+import logging
+
+from .connection_pool import ConnectionPool, get_pool
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+# identifies this worker process in research_leases and research_job_items
+LEASE_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaseStore:
+    """Per-startup research leases shared by every process using the database.
+
+    A lease is taken before researching a company and dropped in the same
+    transaction that saves the result (see DatabaseService._write_startups), so
+    a worker that sees the lease disappear can read the finished record.
+    Expired leases, e.g. from a crashed worker, can be taken over.
+    """
+
+    def __init__(self, db_path: str = config.DATABASE_PATH, owner: str = LEASE_OWNER, ttl: float = config.RESEARCH_LEASE_TTL):
+        self.pool: ConnectionPool = get_pool(db_path)
+        self.owner = owner
+        self.ttl = ttl
+
+    def try_acquire(self, startup_id: str) -> bool:
+        now = time.time()
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                '''
+                INSERT INTO research_leases (startup_id, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(startup_id) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE research_leases.expires_at < ? OR research_leases.owner = excluded.owner
+                ''',
+                (startup_id, self.owner, now + self.ttl, now)
+            )
+            conn.commit()
+            return cursor.rowcount == 1
+
+    def renew(self, startup_id: str) -> bool:
+        with self.pool.connection() as conn:
+            cursor = conn.execute(
+                "UPDATE research_leases SET expires_at = ? WHERE startup_id = ? AND owner = ?",
+                (time.time() + self.ttl, startup_id, self.owner)
+            )
+            conn.commit()
+            return cursor.rowcount == 1
+
+    def release(self, startup_id: str):
+        with self.pool.connection() as conn:
+            conn.execute(
+                "DELETE FROM research_leases WHERE startup_id = ? AND owner = ?",
+                (startup_id, self.owner)
+            )
+            conn.commit()
@@ -0,0 +1,120 @@
+import asyncio
+import traceback
+from typing import Any, Awaitable, Callable, Collection, Dict, Iterable, Optional, Tuple
+import logging
+
+from .metrics import STAGE_ERRORS
+
+logger = logging.getLogger(__name__)
+
+# (context, results of finished stages) -> this stage's result
+StageFunc = Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[Any]]
+
+
+class Stage:
+    def __init__(
+        self,
+        name: str,
+        func: StageFunc,
+        depends_on: Tuple[str, ...] = (),
+        timeout: Optional[float] = None,
+        source: Optional[str] = None,
+        budget_share: float = 1.0
+    ):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        # None or <= 0 means no timeout
+        self.timeout = timeout if timeout and timeout > 0 else None
+        # the Startup.source_updated key this stage refreshes, if any
+        self.source = source
+        # at most this fraction of the time left before the deadline, so dependents still get a turn
+        self.budget_share = budget_share
+
+
+class StagePipeline:
+    """Runs research stages as a dependency graph.
+
+    Every stage starts as soon as the stages it depends on have finished, so
+    independent sources are fetched concurrently. A stage that fails, times out
+    or is skipped has no result, and the stages depending on it are skipped too
+    (recorded with the error that stopped them).
+    """
+
+    def __init__(self, stages: Iterable[Stage] = ()):
+        self.stages: Dict[str, Stage] = {}
+        for stage in stages:
+            self.add(stage)
+
+    def add(self, stage: Stage):
+        # dependencies must already be registered, which also rules out cycles
+        if stage.name in self.stages:
+            raise ValueError(f"Duplicate stage: {stage.name}")
+        missing = [name for name in stage.depends_on if name not in self.stages]
+        if missing:
+            raise ValueError(f"Stage {stage.name} depends on unknown stages: {', '.join(missing)}")
+        self.stages[stage.name] = stage
+
+    def stages_for(self, sources: Collection[str]) -> set:
+        """Names of the stages refreshing the given sources (or no source), plus everything they depend on."""
+        names = set()
+        pending = [stage.name for stage in self.stages.values() if stage.source is None or stage.source in sources]
+        while pending:
+            name = pending.pop()
+            if name not in names:
+                names.add(name)
+                pending.extend(self.stages[name].depends_on)
+        return names
+
+    async def run(
+        self,
+        context: Dict[str, Any],
+        only: Optional[Collection[str]] = None,
+        deadline: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, BaseException]]:
+        """Run the stages (all of them, or just those named in only); returns (results, errors) by stage name.
+
+        deadline is an event loop time after which every unfinished stage is cut off.
+        """
+        loop = asyncio.get_running_loop()
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage):
+            if stage.depends_on:
+                await asyncio.wait([tasks[name] for name in stage.depends_on])
+            if only is not None and stage.name not in only:
+                return
+            failed = [name for name in stage.depends_on if name in errors]
+            if failed:
+                errors[stage.name] = errors[failed[0]]
+                return
+            if any(name not in results for name in stage.depends_on):
+                return
+
+            timeout = stage.timeout
+            if deadline is not None:
+                budget = max(deadline - loop.time(), 0.0) * stage.budget_share
+                timeout = budget if timeout is None else min(timeout, budget)
+            try:
+                results[stage.name] = await asyncio.wait_for(stage.func(context, results), timeout)
+            except asyncio.TimeoutError as e:
+                STAGE_ERRORS.inc(stage=stage.name)
+                logger.error("Stage %s timed out after %.2fs for %s", stage.name, timeout, context.get("company_name"))
+                errors[stage.name] = e
+            except Exception as e:
+                STAGE_ERRORS.inc(stage=stage.name)
+                logger.error("Error in stage %s for %s: %s", stage.name, context.get("company_name"), e)
+                logger.error(traceback.format_exc())
+                errors[stage.name] = e
+
+        # stages are registered after their dependencies, so those tasks always exist first
+        for stage in self.stages.values():
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        return results, errors
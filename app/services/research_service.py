@@ -1,83 +1,228 @@
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 import logging
 import traceback
+from datetime import datetime
 from ..models.startup import Startup
 from .scraper_service import ScraperService
-from .database import DatabaseService
+from .wikipedia_client import WikipediaBatchClient
+from .async_database import AsyncDatabaseService
+from .startup_writer import StartupWriter
+from .scheduler import ResearchScheduler, get_scheduler
+from .http_client import HttpClient
+from .leases import LeaseStore
+from .single_flight import SingleFlight, get_single_flight
+from .pipeline import Stage, StagePipeline
+from .. import config
+from ..logging_config import PAYLOAD
+from .metrics import PARTIAL_RESULTS, RESEARCH_TOTAL, timed
 
 logger = logging.getLogger(__name__)
 
+RESEARCH_SOURCES = ("website", "wikipedia", "news")
+
+# fields each source fills in, reported in Startup.missing_fields when the source did not complete
+SOURCE_FIELDS = {
+    "website": ("website", "description", "products", "social_media"),
+    "wikipedia": ("founded_year", "headquarters", "industry", "funding", "founders", "employees_count"),
+    "news": ("news",),
+}
+
+# a Wikipedia lookup only counts as fresh data when it found at least one of these
+WIKIPEDIA_FIELDS = ("founded_year", "headquarters", "founders", "funding", "employees_count")
+
+
+def startup_id(company_name: str) -> str:
+    return company_name.lower().replace(" ", "-")
+
 class ResearchService:
     
-    def __init__(self, db_service: DatabaseService):
-        self.scraper = ScraperService()
+    def __init__(
+        self,
+        db_service: AsyncDatabaseService,
+        scheduler: Optional[ResearchScheduler] = None,
+        http_client: Optional[HttpClient] = None,
+        writer: Optional[StartupWriter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        leases: Optional[LeaseStore] = None
+    ):
+        self.scheduler = scheduler or get_scheduler()
+        self.scraper = ScraperService(scheduler=self.scheduler, http_client=http_client)
+        self.wikipedia = WikipediaBatchClient(self.scraper)
         self.db_service = db_service
+        self.writer = writer or StartupWriter(db_service)
+        self.single_flight = single_flight or get_single_flight()
+        self.leases = leases or LeaseStore(db_service.db.db_path)
+        # per-company research stages; add a Stage here to plug in another source
+        self.pipeline = self._build_pipeline()
+    
+    def _build_pipeline(self) -> StagePipeline:
+        timeouts = config.STAGE_TIMEOUTS
+        return StagePipeline([
+            Stage(
+                "serpapi_search",
+                self._search_website,
+                timeout=timeouts["serpapi_search"],
+                source="website",
+                budget_share=config.STAGE_BUDGET_SHARES.get("serpapi_search", 1.0)
+            ),
+            Stage("website_fetch", self._scrape_website, ("serpapi_search",), timeouts["website_fetch"], "website"),
+            Stage("wikipedia", self._lookup_wikipedia, timeout=timeouts["wikipedia"], source="wikipedia"),
+            Stage("news", self._search_news, timeout=timeouts["news"], source="news"),
+        ])
+    
+    async def _search_website(self, context: Dict[str, Any], results: Dict[str, Any]) -> Optional[str]:
+        logger.info("Searching for %s website...", context["company_name"])
+        website_url = await self.scraper.search_company_website(
+            context["company_name"], context["bypass_cache"], context["priority"]
+        )
+        logger.info("Found website URL: %s", website_url)
+        return website_url
+    
+    async def _scrape_website(self, context: Dict[str, Any], results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        website_url = results["serpapi_search"]
+        if not website_url:
+            return None
+        logger.info("Scraping website data from %s...", website_url)
+        website_data = await self.scraper.scrape_company_website(
+            website_url, context["bypass_cache"], raise_errors=True, priority=context["priority"]
+        )
+        logger.info("Website data: %s", website_data, extra=PAYLOAD)
+        return website_data
+    
+    async def _lookup_wikipedia(self, context: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info("Searching for %s info...", context["company_name"])
+        if context.get("batch_wikipedia"):
+            # companies of one batch share their extract/wikitext requests
+            company_data = await self.wikipedia.lookup(
+                context["company_name"], context["bypass_cache"], context["priority"]
+            )
+        else:
+            company_data = await self.scraper.search_crunchbase(
+                context["company_name"], context["bypass_cache"], raise_errors=True, priority=context["priority"]
+            )
+        logger.info("Company data: %s", company_data, extra=PAYLOAD)
+        return company_data
     
-    async def research_startup(self, company_name: str) -> Startup:
-        logger.info(f"Starting research for: {company_name}")
+    async def _search_news(self, context: Dict[str, Any], results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        logger.info("Searching news for %s...", context["company_name"])
+        with timed("news"):
+            news_data = await self.scraper.search_news(context["company_name"])
+        logger.info("News data count: %s", len(news_data))
+        return news_data
+    
+    def is_stale(self, existing: Optional[Startup], source: str, force: bool = False) -> bool:
+        if force or existing is None or not existing.source_updated:
+            return True
+        updated = existing.source_updated.get(source)
+        if updated is None:
+            return True
+        return (datetime.now() - updated).total_seconds() > config.SOURCE_MAX_AGE[source]
+    
+    async def research_startup(
+        self,
+        company_name: str,
+        bypass_cache: bool = False,
+        batch_wikipedia: bool = False,
+        existing: Optional[Startup] = None,
+        force: bool = False,
+        deadline: Optional[float] = None,
+        priority: int = config.PRIORITY_BULK
+    ) -> Startup:
+        """Research one company; deadline (seconds, default RESEARCH_DEADLINE) bounds all of its stages."""
+        logger.info("Starting research for: %s", company_name)
         
         try:
+            stale = {source: self.is_stale(existing, source, force) for source in RESEARCH_SOURCES}
+            if not any(stale.values()):
+                logger.info("All sources for %s are fresh, keeping the stored record", company_name)
+                RESEARCH_TOTAL.inc(outcome="fresh")
+                return existing
             
-            await self.scraper.init_session()
+            now = datetime.now()
+            source_updated = dict(existing.source_updated or {}) if existing else {}
+            for source, refetch in stale.items():
+                if not refetch:
+                    logger.info("%s data for %s is fresh, reusing it", source.capitalize(), company_name)
             
-            logger.info(f"Searching for {company_name} website...")
-            try:
-                website_url = await self.scraper.search_company_website(company_name)
-                logger.info(f"Found website URL: {website_url}")
-            except Exception as e:
-                logger.error(f"Error searching company website: {str(e)}")
-                logger.error(traceback.format_exc())
-                website_url = None
+            # independent sources run concurrently; only stages feeding a stale source are started
+            context = {
+                "company_name": company_name,
+                "bypass_cache": bypass_cache,
+                "batch_wikipedia": batch_wikipedia,
+                "priority": priority
+            }
+            stale_sources = [source for source, refetch in stale.items() if refetch]
+            if deadline is None:
+                deadline = config.RESEARCH_DEADLINE
+            deadline_at = asyncio.get_running_loop().time() + deadline if deadline > 0 else None
+            results, _ = await self.pipeline.run(context, self.pipeline.stages_for(stale_sources), deadline_at)
             
-            website_data = {}
-            if website_url:
-                logger.info(f"Scraping website data from {website_url}...")
-                try:
-                    website_data = await self.scraper.scrape_company_website(website_url)
-                    logger.info(f"Website data: {website_data}")
-                except Exception as e:
-                    logger.error(f"Error scraping website: {str(e)}")
-                    logger.error(traceback.format_exc())
+            website_url = results.get("serpapi_search")
+            website_data = results.get("website_fetch") or {}
+            company_data = results.get("wikipedia") or {}
+            news_data = results.get("news") or []
             
-            logger.info(f"Searching for {company_name} info...")
-            try:
-                company_data = await self.scraper.search_crunchbase(company_name)
-                logger.info(f"Company data: {company_data}")
-            except Exception as e:
-                logger.error(f"Error getting company info: {str(e)}")
-                logger.error(traceback.format_exc())
-                company_data = {}
+            if results.get("website_fetch") is not None:
+                source_updated["website"] = now
+            # an empty lookup is retried next time instead of being trusted for the whole max age
+            if any(company_data.get(field) for field in WIKIPEDIA_FIELDS):
+                source_updated["wikipedia"] = now
+            if "news" in results:
+                source_updated["news"] = now
             
-            logger.info(f"Searching news for {company_name}...")
-            try:
-                news_data = await self.scraper.search_news(company_name)
-                logger.info(f"News data count: {len(news_data)}")
-            except Exception as e:
-                logger.error(f"Error searching news: {str(e)}")
-                logger.error(traceback.format_exc())
-                news_data = []
+            fresh = {
+                "website": website_url or website_data.get("website"),
+                "description": website_data.get("description"),
+                "founded_year": company_data.get("founded_year"),
+                "headquarters": company_data.get("headquarters"),
+                "industry": company_data.get("industry"),
+                "funding": company_data.get("funding"),
+                "founders": company_data.get("founders"),
+                "employees_count": company_data.get("employees_count"),
+                "products": website_data.get("products"),
+                "social_media": website_data.get("social_media"),
+                "news": news_data
+            }
+            
+            # refetched sources win; anything they did not return keeps its stored value
+            previous = existing.model_dump() if existing else {}
             
-            await self.scraper.close_session()
+            def merge(field: str, default: Any = None) -> Any:
+                return fresh[field] or previous.get(field) or default
             
             combined_data = {
-                "website": website_url or website_data.get("website") or f"https://{company_name.lower().replace(' ', '')}.com",
-                "description": website_data.get("description") or f"{company_name} is a company in the technology sector.",
-                "founded_year": company_data.get("founded_year") or "N/A",
-                "headquarters": company_data.get("headquarters") or "N/A",
-                "industry": company_data.get("industry") or ["Technology"],
-                "funding": company_data.get("funding") or {"Estimated": "Unknown"},
-                "founders": company_data.get("founders") or [],
-                "employees_count": company_data.get("employees_count"),
-                "products": website_data.get("products") or [],
-                "social_media": website_data.get("social_media") or {},
-                "news": news_data
+                "website": merge("website", f"https://{company_name.lower().replace(' ', '')}.com"),
+                "description": merge("description", f"{company_name} is a company in the technology sector."),
+                "founded_year": merge("founded_year", "N/A"),
+                "headquarters": merge("headquarters", "N/A"),
+                "industry": merge("industry", ["Technology"]),
+                "funding": merge("funding", {"Estimated": "Unknown"}),
+                "founders": merge("founders", []),
+                "employees_count": merge("employees_count"),
+                "products": merge("products", []),
+                "social_media": merge("social_media", {}),
+                "news": merge("news", [])
             }
             
-            logger.info(f"Combined data for {company_name}: {combined_data}")
+            # sources that failed or ran out of time leave placeholders; the caller gets told which fields
+            incomplete = [
+                source for source in stale_sources
+                if any(results.get(stage.name) is None for stage in self.pipeline.stages.values() if stage.source == source)
+            ]
+            missing_fields = [
+                field for source in incomplete for field in SOURCE_FIELDS[source]
+                if not fresh[field] and not previous.get(field)
+            ]
+            for source in incomplete:
+                PARTIAL_RESULTS.inc(source=source)
+            if missing_fields:
+                logger.info("Returning partial result for %s, missing %s", company_name, missing_fields)
+            
+            logger.info("Combined data for %s: %s", company_name, combined_data, extra=PAYLOAD)
             
             startup = Startup(
-                id=company_name.lower().replace(" ", "-"),
+                id=startup_id(company_name),
                 name=company_name,
                 website=combined_data.get("website"),
                 description=combined_data.get("description"),
@@ -89,22 +234,154 @@ class ResearchService:
                 employees_count=combined_data.get("employees_count"),
                 products=combined_data.get("products"),
                 social_media=combined_data.get("social_media"),
-                news=combined_data.get("news")
+                news=combined_data.get("news"),
+                source_updated=source_updated,
+                missing_fields=missing_fields or None
             )
-            self.db_service.save_startup(startup)
+            await self.writer.add(startup)
             
-            logger.info(f"Completed research for: {company_name}")
+            logger.info("Completed research for: %s", company_name)
+            RESEARCH_TOTAL.inc(outcome="researched")
             return startup
         
         except Exception as e:
-            logger.error(f"Error researching {company_name}: {str(e)}")
+            RESEARCH_TOTAL.inc(outcome="failed")
+            logger.error("Error researching %s: %s", company_name, e)
             logger.error(traceback.format_exc())
             
             return Startup(name=company_name)
     
-    async def research_startups(self, company_names: List[str]) -> List[Startup]:
-        logger.info(f"Starting batch research for {len(company_names)} startups")
-        tasks = [self.research_startup(name) for name in company_names]
+    async def _scheduled_research(
+        self,
+        company_name: str,
+        priority: int,
+        bypass_cache: bool = False,
+        batch_wikipedia: bool = False,
+        existing: Optional[Startup] = None,
+        force: bool = False,
+        deadline: Optional[float] = None
+    ) -> Startup:
+        # duplicates in this process share one run; other processes wait on the lease
+        return await self.single_flight.run(
+            startup_id(company_name),
+            lambda: self._leased_research(company_name, priority, bypass_cache, batch_wikipedia, existing, force, deadline)
+        )
+    
+    async def _leased_research(
+        self,
+        company_name: str,
+        priority: int,
+        bypass_cache: bool,
+        batch_wikipedia: bool,
+        existing: Optional[Startup],
+        force: bool,
+        deadline: Optional[float] = None
+    ) -> Startup:
+        key = startup_id(company_name)
+        waited = False
+        while not await self.db_service.run(self.leases.try_acquire, key):
+            if not waited:
+                logger.info("%s is being researched by another worker, waiting for it", company_name)
+            waited = True
+            await asyncio.sleep(config.RESEARCH_LEASE_POLL)
+        
+        if waited:
+            # the other worker's result is stored now; only sources it could not refresh are refetched
+            existing = await self.db_service.get_startup(key)
+            force = False
+        
+        renewer = asyncio.create_task(self._renew_lease(key))
+        try:
+            async with self.scheduler.slot(priority):
+                with timed("research_total"):
+                    return await self.research_startup(
+                        company_name, bypass_cache, batch_wikipedia, existing, force, deadline, priority
+                    )
+        finally:
+            renewer.cancel()
+            # a buffered result drops the lease when the writer commits it
+            if not self.writer.has_pending(key):
+                await self.db_service.run(self.leases.release, key)
+    
+    async def _renew_lease(self, key: str):
+        while True:
+            await asyncio.sleep(self.leases.ttl / 3)
+            try:
+                await self.db_service.run(self.leases.renew, key)
+            except Exception as e:
+                logger.error("Error renewing research lease for %s: %s", key, e)
+    
+    async def _start_research(
+        self,
+        company_names: List[str],
+        priority: Optional[int] = None,
+        bypass_cache: bool = False,
+        force: bool = False,
+        deadline: Optional[float] = None
+    ) -> List[asyncio.Task]:
+        if priority is None:
+            # single-company lookups are interactive and jump ahead of bulk backfills
+            priority = config.PRIORITY_INTERACTIVE if len(company_names) == 1 else config.PRIORITY_BULK
+        
+        existing = {}
+        if not force:
+            existing = await self.db_service.get_startups(list({startup_id(name) for name in company_names}))
+        
+        # Wikipedia extracts and wikitext are fetched for many companies per request
+        batch_wikipedia = len(company_names) > 1
+        
+        return [
+            asyncio.ensure_future(
+                self._scheduled_research(
+                    name,
+                    priority,
+                    bypass_cache,
+                    batch_wikipedia,
+                    existing.get(startup_id(name)),
+                    force,
+                    deadline
+                )
+            )
+            for name in company_names
+        ]
+    
+    async def research_startups(
+        self,
+        company_names: List[str],
+        priority: Optional[int] = None,
+        bypass_cache: bool = False,
+        force: bool = False,
+        deadline: Optional[float] = None
+    ) -> List[Startup]:
+        logger.info("Starting batch research for %s startups", len(company_names))
+        tasks = await self._start_research(company_names, priority, bypass_cache, force, deadline)
         results = await asyncio.gather(*tasks)
+        # results buffered by this batch are durable before the caller sees them
+        await self.writer.flush()
         logger.info("Completed batch research")
-        return results 
\ No newline at end of file
+        return results
+    
+    async def iter_research(
+        self,
+        company_names: List[str],
+        priority: Optional[int] = None,
+        bypass_cache: bool = False,
+        force: bool = False,
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[Tuple[int, Startup]]:
+        """Yield (index, startup) pairs in completion order rather than request order."""
+        logger.info("Starting streamed research for %s startups", len(company_names))
+        tasks = await self._start_research(company_names, priority, bypass_cache, force, deadline)
+        positions = {task: index for index, task in enumerate(tasks)}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=positions.get):
+                    yield positions[task], task.result()
+            await self.writer.flush()
+            logger.info("Completed streamed research")
+        finally:
+            # the client went away: stop researching companies nobody will receive
+            for task in pending:
+                task.cancel()
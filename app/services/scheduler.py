@@ -0,0 +1,166 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class PrioritySemaphore:
+    """Semaphore that hands free slots to the waiter with the lowest priority value first."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._waiters = []
+        self._counter = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    async def acquire(self, priority: int):
+        if self.in_flight < self.limit and not self.waiting:
+            self.in_flight += 1
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # the slot was handed to us after we were cancelled
+                self.release()
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if fut.done():
+                continue
+            self.in_flight += 1
+            fut.set_result(None)
+            break
+
+
+class HostLimiter:
+    def __init__(self, concurrency: int, rate: float, burst: float):
+        self.limit = concurrency
+        # priority-ordered like the global slots, so interactive requests skip queued bulk ones
+        self.semaphore = PrioritySemaphore(concurrency)
+        self.bucket = TokenBucket(rate, burst)
+        self.in_flight = 0
+
+    @property
+    def waiting(self) -> int:
+        return self.semaphore.waiting
+
+
+class ResearchScheduler:
+
+    def __init__(
+        self,
+        max_concurrency: int = config.RESEARCH_MAX_CONCURRENCY,
+        host_concurrency: Optional[Dict[str, int]] = None,
+        host_rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        default_host_concurrency: int = config.HOST_DEFAULT_CONCURRENCY,
+        default_host_rate: Tuple[float, float] = config.HOST_DEFAULT_RATE,
+    ):
+        self.slots = PrioritySemaphore(max_concurrency)
+        self.host_concurrency = host_concurrency if host_concurrency is not None else dict(config.HOST_CONCURRENCY)
+        self.host_rate_limits = host_rate_limits if host_rate_limits is not None else dict(config.HOST_RATE_LIMITS)
+        self.default_host_concurrency = default_host_concurrency
+        self.default_host_rate = default_host_rate
+        self.hosts: Dict[str, HostLimiter] = {}
+
+    def _host_limiter(self, host: str) -> HostLimiter:
+        limiter = self.hosts.get(host)
+        if limiter is None:
+            rate, burst = self.host_rate_limits.get(host, self.default_host_rate)
+            limiter = HostLimiter(
+                self.host_concurrency.get(host, self.default_host_concurrency),
+                rate,
+                burst
+            )
+            self.hosts[host] = limiter
+        return limiter
+
+    @asynccontextmanager
+    async def slot(self, priority: int = config.PRIORITY_BULK):
+        await self.slots.acquire(priority)
+        try:
+            yield
+        finally:
+            self.slots.release()
+
+    @asynccontextmanager
+    async def host_slot(self, url: str, priority: int = config.PRIORITY_BULK):
+        host = urlparse(url).hostname or ""
+        limiter = self._host_limiter(host)
+
+        await limiter.semaphore.acquire(priority)
+        try:
+            await limiter.bucket.acquire()
+            limiter.in_flight += 1
+            try:
+                yield
+            finally:
+                limiter.in_flight -= 1
+        finally:
+            limiter.semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.slots.waiting,
+            "in_flight": self.slots.in_flight,
+            "max_concurrency": self.slots.limit,
+            "hosts": {
+                host: {
+                    "in_flight": limiter.in_flight,
+                    "waiting": limiter.waiting,
+                    "limit": limiter.limit,
+                }
+                for host, limiter in self.hosts.items()
+            }
+        }
+
+
+_scheduler: Optional[ResearchScheduler] = None
+
+
+def get_scheduler() -> ResearchScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ResearchScheduler()
+    return _scheduler
@@ -1,95 +1,303 @@
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
-import re
-import json
-from typing import Dict, Any, List, Optional
+import random
+import time
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
 import logging
 import urllib.parse
+from contextlib import asynccontextmanager
+from .scheduler import ResearchScheduler, get_scheduler
+from .http_client import HttpClient, get_http_client
+from .http_cache import CachedResponse, ResponseCache, get_response_cache
+from .extraction import WikipediaExtractor, get_extractor
+from .html_parser import HtmlParserPool, PageScanner, get_parser_pool, is_html_content_type
+from .circuit_breaker import CircuitBreakers, CircuitOpenError, get_circuit_breakers
+from .metrics import CIRCUIT_REJECTED, HTTP_CACHE, HTTP_REQUESTS, HTTP_SECONDS, RETRIES, STAGE_ERRORS, timed
+from .. import config
 
 logger = logging.getLogger(__name__)
 
+# upstream answers worth retrying (and counted against the host's circuit breaker)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Full-jitter exponential backoff, stretched to a numeric Retry-After when the host sent one."""
+    delay = random.uniform(0, min(config.HTTP_RETRY_MAX_BACKOFF, config.HTTP_RETRY_BACKOFF * 2 ** attempt))
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, min(float(retry_after), config.HTTP_RETRY_MAX_BACKOFF))
+    return delay
+
 class ScraperService:    
-    def __init__(self):
+    def __init__(
+        self,
+        scheduler: Optional[ResearchScheduler] = None,
+        http_client: Optional[HttpClient] = None,
+        cache: Optional[ResponseCache] = None,
+        extractor: Optional[WikipediaExtractor] = None,
+        html_parser: Optional[HtmlParserPool] = None,
+        breakers: Optional[CircuitBreakers] = None
+    ):
         self.session = None
+        self.scheduler = scheduler or get_scheduler()
+        self.http = http_client or get_http_client()
+        self.cache = cache or get_response_cache()
+        self.extractor = extractor or get_extractor()
+        self.html_parser = html_parser or get_parser_pool()
+        self.breakers = breakers or get_circuit_breakers()
     
     async def init_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession(headers={
-                "User-Agent": "Startup-Research-App/1.0"
-            })
+        if self.session is None or self.session.closed:
+            self.session = await self.http.start()
     
     async def close_session(self):
-        if self.session:
-            await self.session.close()
-            self.session = None
+        # the pooled session belongs to the HttpClient and outlives this scraper;
+        # only drop our reference so concurrent tasks keep their connections
+        self.session = None
     
-    async def search_company_website(self, company_name: str) -> Optional[str]:
+    @asynccontextmanager
+    async def _get(self, url: str, priority: int = config.PRIORITY_BULK, **kwargs):
+        await self.init_session()
+        host = urllib.parse.urlparse(url).hostname or ""
+        breaker = self.breakers.get(host)
+        if not breaker.allow():
+            CIRCUIT_REJECTED.inc(host=host)
+            raise CircuitOpenError(f"Circuit open for {host}")
+        
+        start = time.perf_counter()
+        status = "error"
+        try:
+            async with self.scheduler.host_slot(url, priority):
+                async with self.session.get(url, **kwargs) as response:
+                    status = response.status
+                    yield response
+        except asyncio.CancelledError:
+            # a cancelled (e.g. hedged or deadline-cut) request says nothing about the host
+            status = "cancelled"
+            raise
+        finally:
+            HTTP_SECONDS.observe(time.perf_counter() - start, host=host)
+            HTTP_REQUESTS.inc(host=host, status=status)
+            if status == "cancelled":
+                breaker.release()
+            elif status == "error" or status in RETRY_STATUSES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+    
+    async def fetch(
+        self,
+        url: str,
+        bypass_cache: bool = False,
+        reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Optional[bytes]]]] = None,
+        priority: int = config.PRIORITY_BULK,
+        **kwargs
+    ) -> CachedResponse:
+        """GET url through the response cache, retries and circuit breaker.
+        
+        priority orders the request in the host's queue (lower goes first).
+        Credentials go in params: they are sent with the request but kept out of
+        the cache key and the logs, which only ever see url.
+        """
+        cached = None
+        host = urllib.parse.urlparse(url).hostname or ""
+        if self.cache and not bypass_cache:
+            cached = await asyncio.to_thread(self.cache.get, url)
+            if cached and cached.fresh:
+                HTTP_CACHE.inc(host=host, result="hit")
+                return cached
+            HTTP_CACHE.inc(host=host, result="stale" if cached else "miss")
+        
+        headers = dict(kwargs.pop("headers", None) or {})
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        
+        async def request() -> Tuple[CachedResponse, bool]:
+            return await self._request(url, host, cached, headers, reader, priority, **kwargs)
+        
+        if host == config.WIKIPEDIA_HOST and config.WIKIPEDIA_HEDGE_AFTER > 0:
+            fetched, store = await self._hedged(request, config.WIKIPEDIA_HEDGE_AFTER)
+        else:
+            fetched, store = await request()
+        
+        if self.cache and store and fetched.status == 200:
+            await asyncio.to_thread(self.cache.put, fetched)
+        return fetched
+    
+    async def _request(
+        self,
+        url: str,
+        host: str,
+        cached: Optional[CachedResponse],
+        headers: Dict[str, str],
+        reader: Optional[Callable[[aiohttp.ClientResponse], Awaitable[Optional[bytes]]]],
+        priority: int,
+        **kwargs
+    ) -> Tuple[CachedResponse, bool]:
+        """GET url, retrying connection errors, timeouts, 429 and 5xx with jittered exponential backoff.
+        
+        Returns the response and whether it should be stored in the cache.
+        """
+        for attempt in range(config.HTTP_MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                async with self._get(url, priority, headers=headers, **kwargs) as response:
+                    if response.status == 304 and cached:
+                        HTTP_CACHE.inc(host=host, result="revalidated")
+                        await asyncio.to_thread(self.cache.refresh, cached)
+                        return cached, False
+                    
+                    if response.status not in RETRY_STATUSES or attempt == config.HTTP_MAX_RETRIES:
+                        # a reader may stop early or return None to skip the body entirely
+                        body = await reader(response) if reader else await response.read()
+                        fetched = CachedResponse(
+                            url,
+                            response.status,
+                            body or b"",
+                            content_type=response.headers.get("Content-Type"),
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified")
+                        )
+                        return fetched, body is not None
+                    retry_after = response.headers.get("Retry-After")
+                    reason = f"status {response.status}"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == config.HTTP_MAX_RETRIES:
+                    raise
+                reason = str(e) or type(e).__name__
+            
+            delay = backoff_delay(attempt, retry_after)
+            RETRIES.inc(kind="http")
+            logger.info("Retrying %s in %.2fs after %s", url, delay, reason)
+            await asyncio.sleep(delay)
+    
+    async def _hedged(self, request: Callable[[], Awaitable[Any]], delay: float) -> Any:
+        """Run request, and a second copy if the first is still pending after delay; the first success wins."""
+        tasks = [asyncio.ensure_future(request())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                RETRIES.inc(kind="hedge")
+                tasks.append(asyncio.ensure_future(request()))
+            
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _read_page(self, response: aiohttp.ClientResponse) -> Optional[bytes]:
+        content_type = response.headers.get("Content-Type")
+        if response.status != 200:
+            return None
+        if not is_html_content_type(content_type):
+            logger.info("Skipping non-HTML response from %s: %s", response.url, content_type)
+            return None
+        
+        max_bytes = config.WEBSITE_MAX_BYTES
+        scanner = PageScanner()
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(config.WEBSITE_CHUNK_SIZE):
+            body += chunk[:max_bytes - len(body)]
+            if len(body) >= max_bytes:
+                logger.info("Stopped reading %s at %s bytes", response.url, max_bytes)
+                break
+            if scanner.feed(body):
+                logger.info("Stopped reading %s after head and %s links (%s bytes)", response.url, scanner.links, len(body))
+                break
+        return bytes(body)
+    
+    async def search_company_website(
+        self,
+        company_name: str,
+        bypass_cache: bool = False,
+        priority: int = config.PRIORITY_BULK
+    ) -> Optional[str]:
         await self.init_session()
         
         
         search_term = urllib.parse.quote(f"{company_name} official website")
-        api_url = f"https://serpapi.com/search.json?engine=google&q={search_term}&api_key=demo"
+        api_url = f"{config.SERPAPI_URL}?engine=google&q={search_term}"
         
         try:
-            logger.info(f"Calling API to find website for: {company_name}")
-            async with self.session.get(api_url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    
-                    organic_results = data.get('organic_results', [])
-                    if organic_results and len(organic_results) > 0:
-                        
-                        for result in organic_results:
-                            link = result.get('link')
-                            title = result.get('title', '').lower()
-                            
-                            
-                            if link and company_name.lower() in title:
-                                logger.info(f"Found company website: {link}")
-                                return link
+            logger.info("Calling API to find website for: %s", company_name)
+            with timed("serpapi_search"):
+                response = await self.fetch(
+                    api_url, bypass_cache, priority=priority, params={"api_key": config.SERPAPI_API_KEY}
+                )
+            if response.status == 200:
+                data = response.json()
                 
-                wiki_terms = {
-                    "Apple": "Inc. technology company",
-                    "Microsoft": "Corporation software company",
-                    "Google": "technology company",
-                    "Amazon": "company Jeff Bezos",
-                    "Tesla": "electric vehicle company Elon Musk",
-                    "Shell": "oil company",
-                    "Target": "retail corporation",
-                    "Orange": "telecommunications company",
-                    "Disney": "entertainment company",
-                    "Delta": "airline company",
-                    "General": "Electric company",
-                    "Ford": "Motor Company",
-                    "Nike": "sportswear company",
-                    "Uber": "ride-sharing company",
-                    "Lyft": "ride-sharing company",
-                    "Oracle": "software company",
-                    "Intel": "semiconductor company",
-                    "Coca-Cola": "beverage company",
-                    "OpenAI": "AI research company",
-                    "Stripe": "payment processing company"
-                }
-                
-                search_suffix = ""
-                if company_name in wiki_terms:
-                    search_suffix = f" {wiki_terms[company_name]}"
-                
-                elif len(company_name.split()) == 1 and company_name.lower() not in ["microsoft", "google", "facebook", "netflix", "stripe", "airbnb", "uber"]:
-                    search_suffix = " company"
                 
-                wiki_name = company_name.replace(' ', '_') + search_suffix.replace(' ', '_')
-                wikipedia_url = f"https://en.wikipedia.org/wiki/{wiki_name}"
-                logger.info(f"Trying Wikipedia fallback: {wikipedia_url}")
-                return wikipedia_url
+                organic_results = data.get('organic_results', [])
+                if organic_results and len(organic_results) > 0:
+                    
+                    for result in organic_results:
+                        link = result.get('link')
+                        title = result.get('title', '').lower()
+                        
+                        
+                        if link and company_name.lower() in title:
+                            logger.info("Found company website: %s", link)
+                            return link
+            
+            wiki_terms = {
+                "Apple": "Inc. technology company",
+                "Microsoft": "Corporation software company",
+                "Google": "technology company",
+                "Amazon": "company Jeff Bezos",
+                "Tesla": "electric vehicle company Elon Musk",
+                "Shell": "oil company",
+                "Target": "retail corporation",
+                "Orange": "telecommunications company",
+                "Disney": "entertainment company",
+                "Delta": "airline company",
+                "General": "Electric company",
+                "Ford": "Motor Company",
+                "Nike": "sportswear company",
+                "Uber": "ride-sharing company",
+                "Lyft": "ride-sharing company",
+                "Oracle": "software company",
+                "Intel": "semiconductor company",
+                "Coca-Cola": "beverage company",
+                "OpenAI": "AI research company",
+                "Stripe": "payment processing company"
+            }
+            
+            search_suffix = ""
+            if company_name in wiki_terms:
+                search_suffix = f" {wiki_terms[company_name]}"
+            
+            elif len(company_name.split()) == 1 and company_name.lower() not in ["microsoft", "google", "facebook", "netflix", "stripe", "airbnb", "uber"]:
+                search_suffix = " company"
+            
+            wiki_name = company_name.replace(' ', '_') + search_suffix.replace(' ', '_')
+            wikipedia_url = f"{config.WIKIPEDIA_PAGE_URL}{wiki_name}"
+            logger.info("Trying Wikipedia fallback: %s", wikipedia_url)
+            return wikipedia_url
                 
         except Exception as e:
-            logger.error(f"Error searching for company website: {e}")
+            STAGE_ERRORS.inc(stage="serpapi_search")
+            logger.error("Error searching for company website: %s", e)
             return None
     
-    async def scrape_company_website(self, url: str) -> Dict[str, Any]:
+    async def scrape_company_website(
+        self,
+        url: str,
+        bypass_cache: bool = False,
+        raise_errors: bool = False,
+        priority: int = config.PRIORITY_BULK
+    ) -> Dict[str, Any]:
         await self.init_session()
         
         result = {
@@ -100,54 +308,40 @@ class ScraperService:
         }
         
         try:
-            logger.info(f"Scraping website: {url}")
-            async with self.session.get(url, timeout=10) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    
-                    meta_desc = soup.find('meta', {'name': 'description'})
-                    if meta_desc:
-                        result["description"] = meta_desc.get('content')
-                        logger.info(f"Found description: {result['description'][:100]}...")
-                    
-                    
-                    social_patterns = {
-                        'twitter': r'twitter\.com|x\.com',
-                        'linkedin': r'linkedin\.com',
-                        'facebook': r'facebook\.com',
-                        'instagram': r'instagram\.com'
-                    }
-                    
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        for platform, pattern in social_patterns.items():
-                            if re.search(pattern, href):
-                                result["social_media"][platform] = href
-                                logger.info(f"Found social media: {platform} - {href}")
-                                break
-                    
+            logger.info("Scraping website: %s", url)
+            with timed("website_fetch"):
+                response = await self.fetch(
+                    url,
+                    bypass_cache,
+                    reader=self._read_page,
+                    priority=priority,
+                    timeout=aiohttp.ClientTimeout(total=config.WEBSITE_TIMEOUT)
+                )
+            if response.status != 200:
+                raise RuntimeError(f"Website fetch failed with status {response.status}")
+            if response.body and is_html_content_type(response.content_type):
+                with timed("html_parse"):
+                    parsed = await self.html_parser.parse(response.body, response.charset)
+                result.update(parsed)
+                
+                if result["description"]:
+                    logger.info("Found description: %s...", result['description'][:100])
+                for platform, href in result["social_media"].items():
+                    logger.info("Found social media: %s - %s", platform, href)
+                if result["products"]:
+                    logger.info("Found products: %s", result['products'])
                     
-                    product_sections = soup.find_all(['section', 'div'], class_=re.compile(r'product|solutions|offering', re.I))
-                    for section in product_sections:
-                        product_names = section.find_all(['h2', 'h3', 'h4'])
-                        for product in product_names:
-                            if product.text.strip() and len(product.text.strip()) < 50:
-                                result["products"].append(product.text.strip())
-                                
-                    if result["products"]:
-                        logger.info(f"Found products: {result['products']}")
-                        
-                return result
+            return result
         except Exception as e:
-            logger.error(f"Error scraping company website: {e}")
+            STAGE_ERRORS.inc(stage="website_fetch")
+            logger.error("Error scraping company website: %s", e)
+            # a failed scrape must not be stored as a fresh, empty one
+            if raise_errors:
+                raise
             return result
     
-    async def search_crunchbase(self, company_name: str) -> Dict[str, Any]:
-        await self.init_session()
-        
-        result = {
+    def empty_company_data(self) -> Dict[str, Any]:
+        return {
             "founded_year": None,
             "headquarters": None,
             "industry": [],
@@ -155,7 +349,8 @@ class ScraperService:
             "founders": [],
             "employees_count": None
         }
-        
+    
+    def wikipedia_search_url(self, company_name: str) -> str:
         wiki_terms = {
             "Apple": "Inc. technology company",
             "Microsoft": "Corporation software company",
@@ -184,94 +379,95 @@ class ScraperService:
             search_suffix = f" {wiki_terms[company_name]}"
         
         search_query = company_name + search_suffix
+        logger.info("Searching Wikipedia for: %s", search_query)
+        return f"{config.WIKIPEDIA_API_URL}?action=query&list=search&srsearch={urllib.parse.quote(search_query)}&format=json"
+    
+    def parse_wikipedia_extract(self, company_name: str, page_content: str, result: Dict[str, Any]):
+        if not page_content:
+            return
+        
+        logger.info("Found Wikipedia page for %s", company_name)
+        
+        for field, value in self.extractor.extract_text(page_content, result).items():
+            logger.info("Found %s: %s", field, value)
+    
+    def parse_wikitext(self, wikitext: str, result: Dict[str, Any]):
+        if not wikitext:
+            return
         
-        wiki_search_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={urllib.parse.quote(search_query)}&format=json"
+        for field, value in self.extractor.extract_infobox(wikitext, result).items():
+            logger.info("Found %s: %s", field, value)
+    
+    def apply_industry_fallback(self, company_name: str, result: Dict[str, Any]):
+        if not result["industry"]:
+            if any(term in company_name.lower() for term in ['ai', 'intelligence', 'tech', 'data']):
+                result["industry"] = ["Technology", "Artificial Intelligence"]
+            elif any(term in company_name.lower() for term in ['pay', 'bank', 'fin']):
+                result["industry"] = ["Fintech", "Financial Services"]
+            else:
+                result["industry"] = ["Technology"]
+    
+    async def search_wikipedia_page_id(
+        self,
+        company_name: str,
+        bypass_cache: bool = False,
+        priority: int = config.PRIORITY_BULK
+    ) -> Optional[int]:
+        with timed("wikipedia_search"):
+            response = await self.fetch(self.wikipedia_search_url(company_name), bypass_cache, priority=priority)
+        if response.status != 200:
+            # still failing after retries; not the same as finding no page
+            raise RuntimeError(f"Wikipedia search failed with status {response.status}")
+        search_results = response.json().get('query', {}).get('search', [])
+        if search_results:
+            return search_results[0].get('pageid')
+        return None
+    
+    async def search_crunchbase(
+        self,
+        company_name: str,
+        bypass_cache: bool = False,
+        raise_errors: bool = False,
+        priority: int = config.PRIORITY_BULK
+    ) -> Dict[str, Any]:
+        await self.init_session()
+        
+        result = self.empty_company_data()
         
         try:
-            logger.info(f"Searching Wikipedia for: {search_query}")
-            async with self.session.get(wiki_search_url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    search_results = data.get('query', {}).get('search', [])
-                    
-                    if search_results:
-                        
-                        page_id = search_results[0].get('pageid')
-                        
-                        
-                        content_url = f"https://en.wikipedia.org/w/api.php?action=query&prop=extracts&exintro&explaintext&pageids={page_id}&format=json"
-                        
-                        async with self.session.get(content_url) as content_response:
-                            if content_response.status == 200:
-                                content_data = await content_response.json()
-                                page_content = content_data.get('query', {}).get('pages', {}).get(str(page_id), {}).get('extract', '')
-                                
-                                
-                                if page_content:
-                                    logger.info(f"Found Wikipedia page for {company_name}")
-                                    
-                                    
-                                    founded_match = re.search(r'founded in (\d{4})', page_content, re.I)
-                                    if founded_match:
-                                        result["founded_year"] = founded_match.group(1)
-                                        logger.info(f"Found founded year: {result['founded_year']}")
-                                    
-                                    
-                                    hq_matches = re.search(r'headquartered in ([^\.]+)', page_content, re.I)
-                                    if hq_matches:
-                                        result["headquarters"] = hq_matches.group(1).strip()
-                                        logger.info(f"Found headquarters: {result['headquarters']}")
-                                    
-                                    
-                                    industry_terms = ['technology', 'software', 'artificial intelligence', 'AI', 'machine learning',
-                                                    'finance', 'fintech', 'healthcare', 'biotech', 'automotive',
-                                                    'retail', 'media', 'telecommunications', 'e-commerce']
-                                    
-                                    for term in industry_terms:
-                                        if re.search(r'\b' + re.escape(term) + r'\b', page_content, re.I):
-                                            result["industry"].append(term.capitalize())
-                                    
-                                    if result["industry"]:
-                                        logger.info(f"Found industries: {result['industry']}")
-                                    
-                                    
-                                    founder_match = re.search(r'founded by ([^\.]+)', page_content, re.I)
-                                    if founder_match:
-                                        founders_text = founder_match.group(1)
-                                        
-                                        founders = re.split(r',|\sand\s', founders_text)
-                                        result["founders"] = [f.strip() for f in founders if f.strip()]
-                                        logger.info(f"Found founders: {result['founders']}")
-                        
-                        parse_url = f"https://en.wikipedia.org/w/api.php?action=parse&pageid={page_id}&prop=wikitext&format=json"
-                        
-                        async with self.session.get(parse_url) as parse_response:
-                            if parse_response.status == 200:
-                                parse_data = await parse_response.json()
-                                wikitext = parse_data.get('parse', {}).get('wikitext', {}).get('*', '')
-                                
-                                if wikitext:
-                                    revenue_match = re.search(r'\|revenue\s*=\s*\{\{.+?\|(.+?)\}\}', wikitext)
-                                    if revenue_match:
-                                        result["funding"]["Revenue"] = revenue_match.group(1).strip()
-                                        logger.info(f"Found revenue: {result['funding']['Revenue']}")
-                                    
-                                    employees_match = re.search(r'\|num_employees\s*=\s*(\d+)', wikitext)
-                                    if employees_match:
-                                        result["employees_count"] = int(employees_match.group(1))
-                                        logger.info(f"Found employees count: {result['employees_count']}")
+            page_id = await self.search_wikipedia_page_id(company_name, bypass_cache, priority)
             
-            if not result["industry"]:
-                if any(term in company_name.lower() for term in ['ai', 'intelligence', 'tech', 'data']):
-                    result["industry"] = ["Technology", "Artificial Intelligence"]
-                elif any(term in company_name.lower() for term in ['pay', 'bank', 'fin']):
-                    result["industry"] = ["Fintech", "Financial Services"]
-                else:
-                    result["industry"] = ["Technology"]
+            if page_id:
+                content_url = f"{config.WIKIPEDIA_API_URL}?action=query&prop=extracts&exintro&explaintext&pageids={page_id}&format=json"
+                
+                page_content = ''
+                with timed("wikipedia_extract"):
+                    content_response = await self.fetch(content_url, bypass_cache, priority=priority)
+                if content_response.status == 200:
+                    content_data = content_response.json()
+                    page_content = content_data.get('query', {}).get('pages', {}).get(str(page_id), {}).get('extract', '')
                 
+                self.parse_wikipedia_extract(company_name, page_content, result)
+                
+                parse_url = f"{config.WIKIPEDIA_API_URL}?action=parse&pageid={page_id}&prop=wikitext&format=json"
+                
+                wikitext = ''
+                with timed("wikipedia_wikitext"):
+                    parse_response = await self.fetch(parse_url, bypass_cache, priority=priority)
+                if parse_response.status == 200:
+                    parse_data = parse_response.json()
+                    wikitext = parse_data.get('parse', {}).get('wikitext', {}).get('*', '')
+                
+                self.parse_wikitext(wikitext, result)
+            
+            self.apply_industry_fallback(company_name, result)
             return result
         except Exception as e:
-            logger.error(f"Error getting company info: {e}")
+            STAGE_ERRORS.inc(stage="wikipedia")
+            logger.error("Error getting company info: %s", e)
+            # callers tracking incomplete sources tell a failed lookup apart from an empty one
+            if raise_errors:
+                raise
             return result
     
     async def search_news(self, company_name: str) -> List[Dict[str, Any]]:
@@ -280,7 +476,7 @@ class ScraperService:
         news_items = []
         
         try:
-            logger.info(f"Searching for news about: {company_name}")
+            logger.info("Searching for news about: %s", company_name)
             
             
             current_date = "2023-05-01" 
@@ -306,9 +502,9 @@ class ScraperService:
                 }
             ]
             
-            logger.info(f"Generated {len(news_items)} demo news items for {company_name}")
+            logger.info("Generated %s demo news items for %s", len(news_items), company_name)
             return news_items
             
         except Exception as e:
-            logger.error(f"Error searching news: {e}")
+            logger.error("Error searching news: %s", e)
             return news_items
\ No newline at end of file
@@ -0,0 +1,153 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+import logging
+
+from ..models.startup import Startup
+from .metrics import STARTUP_CACHE
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class CachedStartup:
+    """A stored startup with its serialized JSON and HTTP validators, built once per version."""
+
+    def __init__(self, startup: Startup, last_updated: str):
+        self.startup = startup
+        self.body = startup.model_dump_json().encode()
+        self.etag = '"' + hashlib.sha1(f"{startup.id}:{last_updated}".encode()).hexdigest()[:20] + '"'
+        # last_updated is the naive local time the row was written
+        self.modified_at = datetime.fromisoformat(last_updated).astimezone(timezone.utc).replace(microsecond=0)
+        self.last_modified = format_datetime(self.modified_at, usegmt=True)
+
+    def not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """Whether a conditional GET with these request headers can be answered with 304."""
+        if if_none_match:
+            # If-None-Match wins over If-Modified-Since; weak comparison as for GET
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+        if if_modified_since:
+            try:
+                return self.modified_at <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+class StartupCache:
+    """Bounded LRU of CachedStartup entries with a TTL, keyed by the id or name they were looked up with.
+
+    Writers call invalidate() after committing; a read that started before the
+    invalidation does not put its (possibly stale) result back. Writes by other
+    processes are caught through version, a counter bumped by every write: when
+    it moves without a matching invalidate() here, every entry is dropped.
+    Reading version touches the database, so get_nowait() skips it and only
+    answers while the last check is younger than version_interval.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = config.STARTUP_CACHE_SIZE,
+        ttl: float = config.STARTUP_CACHE_TTL,
+        version: Optional[Callable[[], float]] = None,
+        version_interval: float = config.STARTUP_CACHE_VERSION_INTERVAL
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version = version
+        self.version_interval = version_interval
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self._seen_version: Optional[float] = None
+        self._version_checked_at: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: str) -> Optional[CachedStartup]:
+        if not self.enabled:
+            return None
+        if self.version is not None:
+            self._check_version()
+        entry = self._lookup(key)
+        STARTUP_CACHE.inc(result="hit" if entry is not None else "miss")
+        return entry
+
+    def get_nowait(self, key: str) -> Optional[CachedStartup]:
+        """A hit that needs no database access, e.g. on the event loop; None means ask get()."""
+        if not self.enabled:
+            return None
+        if self.version is not None:
+            checked_at = self._version_checked_at
+            if checked_at is None or time.monotonic() - checked_at >= self.version_interval:
+                return None
+        entry = self._lookup(key)
+        if entry is not None:
+            STARTUP_CACHE.inc(result="hit")
+        return entry
+
+    def _lookup(self, key: str) -> Optional[CachedStartup]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            entry, expires_at = item
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                return entry
+            del self._entries[key]
+            return None
+
+    def put(self, key: str, entry: CachedStartup, generation: int):
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (entry, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _check_version(self):
+        checked_at = time.monotonic()
+        version = self.version()
+        with self._lock:
+            self._version_checked_at = checked_at
+            if version == self._seen_version:
+                return
+            if self._entries:
+                logger.debug("Startups changed in another process, dropping %s cached lookups", len(self._entries))
+            self._seen_version = version
+            self.generation += 1
+            self._entries.clear()
+
+    def invalidate(self, startups: Iterable[Startup], version: Optional[float] = None):
+        """Drop entries for these startups, whether they were looked up by id or by name.
+
+        version is the write counter after this write; when it directly follows the
+        last one seen, nobody else wrote in between and the other entries stay.
+        """
+        ids = {startup.id for startup in startups}
+        keys = ids | {startup.name for startup in startups}
+        with self._lock:
+            self.generation += 1
+            for key in [key for key, (entry, _) in self._entries.items() if key in keys or entry.startup.id in ids]:
+                del self._entries[key]
+            if version is not None and self._seen_version is not None and version == self._seen_version + 1:
+                self._seen_version = version
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
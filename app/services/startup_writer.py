@@ -0,0 +1,99 @@
+import asyncio
+from typing import List, Optional, Set
+import logging
+
+from ..models.startup import Startup
+from .async_database import AsyncDatabaseService, get_async_database_service
+from .metrics import RETRIES, timed
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class StartupWriter:
+    """Buffers research results and writes them with DatabaseService.save_startups.
+
+    A batch is flushed when it reaches max_batch records or max_delay seconds
+    after its first record, whichever comes first; close() flushes the rest.
+    """
+
+    def __init__(
+        self,
+        db_service: AsyncDatabaseService,
+        max_batch: int = config.WRITE_BATCH_SIZE,
+        max_delay: float = config.WRITE_FLUSH_INTERVAL
+    ):
+        self.db_service = db_service
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._buffer: List[Startup] = []
+        self._saving: Set[str] = set()
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def has_pending(self, startup_id: str) -> bool:
+        """Whether a record for startup_id is buffered or being written right now."""
+        return startup_id in self._saving or any(startup.id == startup_id for startup in self._buffer)
+
+    async def add(self, startup: Startup):
+        self._buffer.append(startup)
+        if len(self._buffer) >= self.max_batch:
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.max_delay)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error("Error flushing buffered startups: %s", e)
+
+    async def flush(self):
+        async with self._lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+
+            self._saving = {startup.id for startup in batch}
+            try:
+                with timed("db_save"):
+                    saved = await self.db_service.save_startups(batch)
+                if saved:
+                    logger.info("Saved %s startups", len(batch))
+                    return
+
+                # isolate the record that broke the batch instead of losing all of them
+                logger.error("Bulk save of %s startups failed, retrying one by one", len(batch))
+                RETRIES.inc(kind="write_batch")
+                for startup in batch:
+                    await self.db_service.save_startup(startup)
+            finally:
+                self._saving = set()
+
+    async def close(self):
+        if self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+        self._timer = None
+        await self.flush()
+
+
+_startup_writer: Optional[StartupWriter] = None
+
+
+def get_startup_writer() -> StartupWriter:
+    global _startup_writer
+    if _startup_writer is None:
+        _startup_writer = StartupWriter(get_async_database_service())
+    return _startup_writer
+
+
+async def close_startup_writer():
+    global _startup_writer
+    if _startup_writer is not None:
+        await _startup_writer.close()
+        _startup_writer = None
@@ -0,0 +1,169 @@
+import asyncio
+import urllib.parse
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+
+from .scraper_service import ScraperService
+from .metrics import timed
+from .. import config
+
+logger = logging.getLogger(__name__)
+
+
+class WikipediaBatchClient:
+    """Looks up company data for concurrently researched companies with multi-page MediaWiki queries.
+
+    Every company searches for its own page from inside its research slot, so the
+    searches are bounded by the scheduler like any other request. Page ids found
+    within batch_window of each other (or until a batch is full) have their intro
+    extracts and infobox wikitext fetched together, and the parsed results are
+    handed back to each company still waiting for them.
+    """
+
+    def __init__(
+        self,
+        scraper: ScraperService,
+        extract_batch_size: int = config.WIKIPEDIA_EXTRACT_BATCH_SIZE,
+        wikitext_batch_size: int = config.WIKIPEDIA_WIKITEXT_BATCH_SIZE,
+        batch_window: float = config.WIKIPEDIA_BATCH_WINDOW
+    ):
+        self.scraper = scraper
+        self.extract_batch_size = extract_batch_size
+        self.wikitext_batch_size = wikitext_batch_size
+        self.batch_window = batch_window
+        # bypass_cache -> (company name, page id, future, priority) waiting for the next batch
+        self._pending: Dict[bool, List[Tuple[str, int, asyncio.Future, int]]] = {}
+        self._timers: Dict[bool, asyncio.TimerHandle] = {}
+        self._tasks = set()
+
+    async def lookup(
+        self,
+        company_name: str,
+        bypass_cache: bool = False,
+        priority: int = config.PRIORITY_BULK
+    ) -> Dict[str, Any]:
+        """Company data from Wikipedia; raises when the search or the batch fetch fails."""
+        page_id = await self.scraper.search_wikipedia_page_id(company_name, bypass_cache, priority)
+        if not page_id:
+            result = self.scraper.empty_company_data()
+            self.scraper.apply_industry_fallback(company_name, result)
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(bypass_cache, [])
+        pending.append((company_name, page_id, future, priority))
+        if len(pending) >= self.extract_batch_size:
+            self._flush(bypass_cache)
+        elif bypass_cache not in self._timers:
+            self._timers[bypass_cache] = asyncio.get_running_loop().call_later(
+                self.batch_window, self._flush, bypass_cache
+            )
+        # a caller cut off by its deadline cancels only its own future, not the batch
+        return await future
+
+    def _flush(self, bypass_cache: bool):
+        timer = self._timers.pop(bypass_cache, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(bypass_cache, [])
+        if not batch:
+            return
+        task = asyncio.create_task(self._process_batch(batch, bypass_cache))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process_batch(self, batch: List[Tuple[str, int, asyncio.Future, int]], bypass_cache: bool):
+        batch = [entry for entry in batch if not entry[2].done()]
+        if not batch:
+            return
+        # the batch runs for its most urgent member
+        priority = min(entry[3] for entry in batch)
+        page_ids = list(dict.fromkeys(page_id for _, page_id, _, _ in batch))
+        try:
+            extracts = await self._fetch_extracts(page_ids, bypass_cache, priority)
+
+            # only pages that resolved to an article are worth pulling wikitext for
+            wikitext_ids = [page_id for page_id in page_ids if page_id in extracts]
+            wikitexts = await self._fetch_wikitexts(wikitext_ids, bypass_cache, priority)
+        except Exception as e:
+            # the companies' wikipedia stages fail, so their fields are reported missing
+            logger.error("Error fetching Wikipedia batch: %s", e)
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for name, page_id, future, _ in batch:
+            result = self.scraper.empty_company_data()
+            try:
+                self.scraper.parse_wikipedia_extract(name, extracts.get(page_id, ''), result)
+                self.scraper.parse_wikitext(wikitexts.get(page_id, ''), result)
+            except Exception as e:
+                logger.error("Error getting company info: %s", e)
+            self.scraper.apply_industry_fallback(name, result)
+            if not future.done():
+                future.set_result(result)
+
+    async def _query_pages(self, params: Dict[str, str], bypass_cache: bool, priority: int) -> List[Dict[str, Any]]:
+        pages = []
+        params = {"action": "query", "format": "json", "formatversion": "2", **params}
+        while True:
+            url = f"{config.WIKIPEDIA_API_URL}?{urllib.parse.urlencode(params)}"
+            response = await self.scraper.fetch(url, bypass_cache, priority=priority)
+            if response.status != 200:
+                raise RuntimeError(f"Wikipedia query failed with status {response.status}")
+
+            data = response.json()
+            pages.extend(data.get('query', {}).get('pages', []))
+
+            # large batches may be split across continuation requests
+            if 'continue' not in data:
+                break
+            params = {**params, **data['continue']}
+        return pages
+
+    async def _fetch_extracts(self, page_ids: List[int], bypass_cache: bool, priority: int) -> Dict[int, str]:
+        chunks = [page_ids[i:i + self.extract_batch_size] for i in range(0, len(page_ids), self.extract_batch_size)]
+        with timed("wikipedia_extract"):
+            responses = await asyncio.gather(*[
+                self._query_pages({
+                    "prop": "extracts",
+                    "exintro": "1",
+                    "explaintext": "1",
+                    "exlimit": "max",
+                    "pageids": "|".join(str(page_id) for page_id in chunk)
+                }, bypass_cache, priority)
+                for chunk in chunks
+            ])
+
+        extracts = {}
+        for pages in responses:
+            for page in pages:
+                if page.get('missing') or 'pageid' not in page:
+                    continue
+                if page.get('extract'):
+                    extracts[page['pageid']] = page['extract']
+                else:
+                    extracts.setdefault(page['pageid'], '')
+        return extracts
+
+    async def _fetch_wikitexts(self, page_ids: List[int], bypass_cache: bool, priority: int) -> Dict[int, str]:
+        chunks = [page_ids[i:i + self.wikitext_batch_size] for i in range(0, len(page_ids), self.wikitext_batch_size)]
+        with timed("wikipedia_wikitext"):
+            responses = await asyncio.gather(*[
+                self._query_pages({
+                    "prop": "revisions",
+                    "rvprop": "content",
+                    "rvslots": "main",
+                    "pageids": "|".join(str(page_id) for page_id in chunk)
+                }, bypass_cache, priority)
+                for chunk in chunks
+            ])
+
+        wikitexts = {}
+        for pages in responses:
+            for page in pages:
+                revisions = page.get('revisions')
+                if revisions:
+                    wikitexts[page['pageid']] = revisions[0].get('slots', {}).get('main', {}).get('content', '')
+        return wikitexts
@@ -0,0 +1,84 @@
+"""Database read paths at growing table sizes: search_startups, run_analytics and get_all_startups.
+
+    python -m benchmarks.bench_database [--rows 1000 10000 100000] [--iterations 20]
+
+Each size gets a throwaway database filled with synthetic startups through save_startups.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Callable, List
+
+from app.models.startup import Startup
+from app.services.connection_pool import close_pools
+from app.services.database import DatabaseService
+
+WORDS = ["cloud", "data", "robotics", "payments", "health", "mobility", "energy", "security", "retail", "media"]
+INDUSTRIES = ["Technology", "Software", "Fintech", "Healthcare", "Retail", "Media", "Automotive", "E-commerce"]
+CITIES = ["Berlin", "Paris", "Austin", "Toronto", "Singapore", "London", "Lisbon", "Seattle"]
+SEARCHES = ["robotics", "payments platform", "Berlin", "health*", '"cloud data"']
+
+
+def synthetic_startups(count: int, seed: int = 42) -> List[Startup]:
+    rng = random.Random(seed)
+    startups = []
+    for i in range(count):
+        words = rng.sample(WORDS, 3)
+        name = f"{words[0].capitalize()}{words[1].capitalize()} {i}"
+        startups.append(Startup(
+            id=f"bench-{i}",
+            name=name,
+            website=f"https://{name.lower().replace(' ', '-')}.example",
+            description=f"{name} builds {words[0]} and {words[1]} tools for {words[2]} teams.",
+            founded_year=rng.randint(1990, 2023),
+            headquarters=rng.choice(CITIES),
+            industry=rng.sample(INDUSTRIES, 2),
+            funding={"Revenue": f"US${rng.randint(1, 900)} million"},
+            founders=[f"Founder {rng.randint(1, 5000)}", f"Founder {rng.randint(1, 5000)}"],
+            employees_count=rng.randint(5, 5000),
+            products=[f"{name} {word}" for word in rng.sample(WORDS, 2)],
+            social_media={"twitter": f"https://twitter.com/bench{i}"},
+        ))
+    return startups
+
+
+def timed(func: Callable[[], object], iterations: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="*", default=[1000, 10000, 100000])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--search-limit", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rows':>7} {'operation':<36} {'ms/op':>10}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory(prefix="bench_database_") as workdir:
+            db = DatabaseService(os.path.join(workdir, "startups.db"))
+            startups = synthetic_startups(rows)
+            start = time.perf_counter()
+            for i in range(0, rows, 1000):
+                db.save_startups(startups[i:i + 1000])
+            print(f"{rows:>7} {'save_startups (per 1k rows)':<36} {(time.perf_counter() - start) / rows * 1e6:>10.2f}")
+
+            for query in SEARCHES:
+                ms = timed(lambda: db.search_startups(query, limit=args.search_limit), args.iterations)
+                print(f"{rows:>7} {'search_startups ' + query:<36} {ms:>10.2f}")
+            for query_type in ("industry_count", "funding_stats", "startup_count"):
+                ms = timed(lambda: db.run_analytics(query_type), args.iterations)
+                print(f"{rows:>7} {'run_analytics ' + query_type:<36} {ms:>10.2f}")
+            ms = timed(db.get_all_startups, max(1, args.iterations // 10))
+            print(f"{rows:>7} {'get_all_startups':<36} {ms:>10.2f}")
+            close_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Microbenchmark: per-term regex extraction (previous code) vs the precompiled extraction engine.
+
+    python -m benchmarks.bench_extraction [--iterations N] [--extra-terms N]
+"""
+import argparse
+import random
+import re
+import string
+import time
+from typing import Dict, Any, List
+
+from app.services.extraction import WikipediaExtractor, get_extractor
+
+LEGACY_INDUSTRY_TERMS = ['technology', 'software', 'artificial intelligence', 'AI', 'machine learning',
+                         'finance', 'fintech', 'healthcare', 'biotech', 'automotive',
+                         'retail', 'media', 'telecommunications', 'e-commerce']
+
+SAMPLE_EXTRACT = (
+    "Acme Robotics, Inc. is an American multinational technology company headquartered in Cupertino, California. "
+    "It was founded in 1976 by Jane Doe, John Roe and Richard Miles. The company designs consumer electronics, "
+    "software and online services, and is a leader in artificial intelligence and machine learning research. "
+    "Its e-commerce platform and media subscriptions make up a growing share of revenue, while its healthcare "
+    "and automotive divisions expanded after several acquisitions. "
+)
+
+
+def legacy_extract(page_content: str, industry_terms: List[str]) -> Dict[str, Any]:
+    result = {"founded_year": None, "headquarters": None, "industry": [], "founders": []}
+
+    founded_match = re.search(r'founded in (\d{4})', page_content, re.I)
+    if founded_match:
+        result["founded_year"] = founded_match.group(1)
+
+    hq_matches = re.search(r'headquartered in ([^\.]+)', page_content, re.I)
+    if hq_matches:
+        result["headquarters"] = hq_matches.group(1).strip()
+
+    for term in industry_terms:
+        if re.search(r'\b' + re.escape(term) + r'\b', page_content, re.I):
+            result["industry"].append(term.capitalize())
+
+    founder_match = re.search(r'founded by ([^\.]+)', page_content, re.I)
+    if founder_match:
+        founders = re.split(r',|\sand\s', founder_match.group(1))
+        result["founders"] = [f.strip() for f in founders if f.strip()]
+
+    return result
+
+
+def engine_extract(extractor: WikipediaExtractor, page_content: str) -> Dict[str, Any]:
+    result = {"founded_year": None, "headquarters": None, "industry": [], "founders": []}
+    extractor.extract_text(page_content, result)
+    return result
+
+
+def synthetic_terms(count: int) -> List[str]:
+    rng = random.Random(42)
+    return [
+        " ".join("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+                 for _ in range(rng.randint(1, 2)))
+        for _ in range(count)
+    ]
+
+
+def timed(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--repeat-text", type=int, default=4, help="repeat the sample paragraph N times")
+    parser.add_argument("--extra-terms", type=int, nargs="*", default=[0, 100, 500])
+    args = parser.parse_args()
+
+    text = SAMPLE_EXTRACT * args.repeat_text
+    base_rules = get_extractor()
+
+    print(f"extract length: {len(text)} chars, {args.iterations} iterations")
+    print(f"{'terms':>6} {'legacy us/op':>14} {'engine us/op':>14} {'speedup':>8}")
+    for extra in args.extra_terms:
+        terms = LEGACY_INDUSTRY_TERMS + synthetic_terms(extra)
+        extractor = WikipediaExtractor({
+            "industries": [{"term": term} for term in terms],
+            "text_fields": {
+                rule.field: {"pattern": rule.pattern.pattern, "flags": "i", "strip": rule.strip,
+                             "split": rule.split.pattern if rule.split else None}
+                for rule in base_rules.text_rules
+            }
+        })
+
+        legacy = legacy_extract(text, terms)
+        engine = engine_extract(extractor, text)
+        assert legacy == engine, (legacy, engine)
+
+        re.purge()
+        legacy_us = timed(lambda: legacy_extract(text, terms), args.iterations)
+        engine_us = timed(lambda: engine_extract(extractor, text), args.iterations)
+        print(f"{len(terms):>6} {legacy_us:>14.1f} {engine_us:>14.1f} {legacy_us / engine_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""End-to-end research throughput against the local stand-in endpoints (no network access needed).
+
+    python -m benchmarks.bench_research [--sizes 10 100 1000] [--latency-ms 50] [--page-kb 64] [--error-rate 0.01]
+
+The stand-in runs in a child process so its CPU and memory stay out of the numbers. Each size researches
+fresh company names into a throwaway database and reports companies/sec, per-stage p50/p99 and peak RSS.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"stand-in server did not start on port {port}")
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+async def run(sizes: List[int], concurrency: int) -> None:
+    # imported here so the environment set up in main() is what app.config sees
+    from app.services import metrics
+    from app.services.async_database import AsyncDatabaseService
+    from app.services.database import DatabaseService
+    from app.services.html_parser import close_parser_pool
+    from app.services.http_client import HttpClient
+    from app.services.research_service import ResearchService
+    from app.services.scheduler import ResearchScheduler
+
+    # keep every raw stage sample; the exported histogram only has coarse buckets
+    samples: Dict[str, List[float]] = defaultdict(list)
+    observe = metrics.STAGE_SECONDS.observe
+
+    def record(value: float, **labels):
+        samples[labels["stage"]].append(value)
+        observe(value, **labels)
+
+    metrics.STAGE_SECONDS.observe = record
+
+    db_service = AsyncDatabaseService(DatabaseService())
+    http_client = HttpClient()
+    await http_client.start()
+    # every stand-in endpoint shares one host, so lift the per-host limits meant for real sites
+    scheduler = ResearchScheduler(
+        host_concurrency={},
+        host_rate_limits={},
+        default_host_concurrency=concurrency,
+        default_host_rate=(1e9, 1e9)
+    )
+    service = ResearchService(db_service, scheduler=scheduler, http_client=http_client)
+
+    try:
+        print(f"{'companies':>9} {'seconds':>8} {'co/sec':>8} {'failed':>6} {'peak RSS MB':>11}")
+        stage_rows = []
+        for size in sizes:
+            samples.clear()
+            names = [f"Bench {size} Company {i}" for i in range(size)]
+            start = time.perf_counter()
+            results = await service.research_startups(names)
+            elapsed = time.perf_counter() - start
+            failed = sum(1 for startup in results if startup.id is None)
+            print(f"{size:>9} {elapsed:>8.2f} {size / elapsed:>8.1f} {failed:>6} {peak_rss_mb():>11.1f}")
+            stage_rows.append((size, {stage: list(values) for stage, values in samples.items()}))
+
+        print()
+        print(f"{'companies':>9} {'stage':<20} {'count':>6} {'p50 ms':>8} {'p99 ms':>8}")
+        for size, stages in stage_rows:
+            for stage, values in sorted(stages.items()):
+                print(f"{size:>9} {stage:<20} {len(values):>6} "
+                      f"{percentile(values, 0.5) * 1000:>8.1f} {percentile(values, 0.99) * 1000:>8.1f}")
+    finally:
+        await service.writer.close()
+        await http_client.close()
+        close_parser_pool()
+        db_service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[10, 100, 1000])
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--page-kb", type=int, default=64)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--research-concurrency", type=int, default=None,
+                        help="RESEARCH_MAX_CONCURRENCY for the run (default: the app's setting)")
+    parser.add_argument("--host-concurrency", type=int, default=200,
+                        help="concurrent requests allowed to the stand-in host")
+    args = parser.parse_args()
+
+    port = free_port()
+    standin = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.standin",
+        "--port", str(port),
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--page-kb", str(args.page_kb),
+        "--error-rate", str(args.error_rate),
+    ], stdout=subprocess.DEVNULL)
+
+    workdir = tempfile.TemporaryDirectory(prefix="bench_research_")
+    base_url = f"http://127.0.0.1:{port}"
+    os.environ.update({
+        "SERPAPI_URL": f"{base_url}/search.json",
+        "WIKIPEDIA_API_URL": f"{base_url}/w/api.php",
+        "WIKIPEDIA_PAGE_URL": f"{base_url}/wiki/",
+        "DATABASE_PATH": os.path.join(workdir.name, "startups.db"),
+        "HTTP_CACHE_ENABLED": "0",
+        "HTTP_POOL_LIMIT": str(args.host_concurrency),
+        "HTTP_POOL_LIMIT_PER_HOST": str(args.host_concurrency),
+        "LOG_PAYLOAD_SAMPLE_RATE": "0",
+    })
+    if args.research_concurrency:
+        os.environ["RESEARCH_MAX_CONCURRENCY"] = str(args.research_concurrency)
+
+    import logging
+    logging.basicConfig(level=logging.WARNING)
+
+    try:
+        wait_for_port(port)
+        print(f"stand-in: {base_url}, latency {args.latency_ms:.0f}±{args.jitter_ms:.0f} ms, "
+              f"pages {args.page_kb} KiB, error rate {args.error_rate:.1%}")
+        asyncio.run(run(args.sizes, args.host_concurrency))
+    finally:
+        standin.terminate()
+        standin.wait()
+        workdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Read endpoint serialization: re-validated pydantic models (previous code) vs stored JSON passed through.
+
+    python -m benchmarks.bench_serialization [--rows 10000] [--limits 100 1000] [--iterations 20]
+
+Both paths run through FastAPI's TestClient against the same throwaway database, so request overhead is
+included on both sides; the projection rows compare only the work inside DatabaseService.list_startups.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+
+def legacy_projection(db, limit: int, fields: List[str]) -> List[str]:
+    # previous list_startups projection: one json_extract per field, then json.loads/json.dumps in Python
+    json_fields = {"industry", "funding", "founders", "products", "social_media", "news"}
+    columns = ", ".join(f"json_extract(s.data, '$.{field}')" for field in fields)
+    with db.pool.connection() as conn:
+        rows = conn.execute(f"SELECT s.rowid, {columns} FROM startups s ORDER BY s.rowid LIMIT ?", (limit,)).fetchall()
+    documents = []
+    for row in rows:
+        document = {}
+        for field, value in zip(fields, row[1:]):
+            if field in json_fields and value is not None:
+                value = json.loads(value)
+            document[field] = value
+        documents.append(json.dumps(document))
+    return documents
+
+
+def timed(func: Callable[[], object], iterations: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--limits", type=int, nargs="*", default=[100, 1000])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--fields", default="id,name,industry,funding,founders")
+    args = parser.parse_args()
+
+    workdir = tempfile.TemporaryDirectory(prefix="bench_serialization_")
+    os.environ["DATABASE_PATH"] = os.path.join(workdir.name, "startups.db")
+    os.environ["LOG_FILE"] = ""
+    os.environ["LOG_LEVEL"] = "WARNING"
+
+    # imported after DATABASE_PATH is set so the app and the legacy endpoints share the throwaway database
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    import main as app_main
+    from app.models.startup import Startup
+    from app.services.database import get_database_service
+    from benchmarks.bench_database import synthetic_startups
+
+    db = get_database_service()
+    startups = synthetic_startups(args.rows)
+    for i in range(0, args.rows, 1000):
+        db.save_startups(startups[i:i + 1000])
+
+    legacy = FastAPI()
+
+    @legacy.get("/api/startups", response_model=List[Startup])
+    def legacy_list(limit: int = 100):
+        with db.pool.connection() as conn:
+            rows = conn.execute("SELECT data FROM startups ORDER BY rowid LIMIT ?", (limit,)).fetchall()
+        return [Startup.model_validate_json(row[0]) for row in rows]
+
+    @legacy.get("/api/search", response_model=Dict[str, Any])
+    def legacy_search(query: str, limit: int = 100):
+        results = db.search(query, limit=limit, match_all=False)
+        return {
+            "type": "search_results",
+            "data": [{**r["startup"].model_dump(), "score": r["score"], "snippet": r["snippet"]} for r in results]
+        }
+
+    fields = args.fields.split(",")
+    print(f"{args.rows} rows, {args.iterations} iterations")
+    print(f"{'operation':<34} {'limit':>6} {'legacy ms':>10} {'fast ms':>10} {'speedup':>8}")
+
+    def report(name: str, limit: int, legacy_ms: float, fast_ms: float):
+        print(f"{name:<34} {limit:>6} {legacy_ms:>10.2f} {fast_ms:>10.2f} {legacy_ms / fast_ms:>7.1f}x")
+
+    with TestClient(app_main.app) as client, TestClient(legacy) as legacy_client:
+        for limit in args.limits:
+            new = client.get(f"/api/startups?limit={limit}").json()
+            old = legacy_client.get(f"/api/startups?limit={limit}").json()
+            assert [row["id"] for row in new] == [row["id"] for row in old]
+            report("GET /api/startups", limit,
+                   timed(lambda: legacy_client.get(f"/api/startups?limit={limit}"), args.iterations),
+                   timed(lambda: client.get(f"/api/startups?limit={limit}"), args.iterations))
+
+            new_docs, _ = db.list_startups(limit, fields=fields)
+            assert [json.loads(doc) for doc in new_docs] == [json.loads(doc) for doc in legacy_projection(db, limit, fields)]
+            report(f"list_startups ({len(fields)} fields)", limit,
+                   timed(lambda: legacy_projection(db, limit, fields), args.iterations),
+                   timed(lambda: db.list_startups(limit, fields=fields), args.iterations))
+
+            chat = {"query": "robotics payments", "limit": limit}
+            report("POST /api/chat (search)", limit,
+                   timed(lambda: legacy_client.get(f"/api/search?query=robotics payments&limit={limit}"), args.iterations),
+                   timed(lambda: client.post("/api/chat", json=chat), args.iterations))
+
+    workdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Local stand-in for the SerpAPI, MediaWiki and company homepage endpoints the scraper calls.
+
+    python -m benchmarks.standin [--port 8900] [--latency-ms 50] [--jitter-ms 20] [--page-kb 64] [--error-rate 0.01]
+
+Point the app at it with SERPAPI_URL, WIKIPEDIA_API_URL and WIKIPEDIA_PAGE_URL (printed on start).
+Responses are generated from the company name, so every run sees the same data.
+"""
+import argparse
+import asyncio
+import random
+import zlib
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+INDUSTRIES = ["technology", "software", "fintech", "healthcare", "retail", "media", "automotive", "e-commerce"]
+CITIES = ["Berlin", "Paris", "Austin", "Toronto", "Singapore", "London", "Lisbon", "Seattle"]
+SOCIAL = ["twitter.com", "linkedin.com/company", "facebook.com", "instagram.com"]
+
+
+def slugify(name: str) -> str:
+    return "-".join(name.lower().split())
+
+
+def page_id(name: str) -> int:
+    return zlib.crc32(name.lower().encode()) or 1
+
+
+class StandinServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8900,
+        latency: float = 0.05,
+        jitter: float = 0.02,
+        page_bytes: int = 64 * 1024,
+        error_rate: float = 0.0,
+        seed: int = 42
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.page_bytes = page_bytes
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        # page id -> company name, filled by searches so later page lookups can be answered
+        self.pages: Dict[int, str] = {}
+        self.requests = 0
+        self._runner = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def env(self) -> Dict[str, str]:
+        return {
+            "SERPAPI_URL": f"{self.base_url}/search.json",
+            "WIKIPEDIA_API_URL": f"{self.base_url}/w/api.php",
+            "WIKIPEDIA_PAGE_URL": f"{self.base_url}/wiki/",
+        }
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._simulate])
+        app.router.add_get("/search.json", self.serpapi_search)
+        app.router.add_get("/w/api.php", self.mediawiki_api)
+        app.router.add_get("/site/{slug}/", self.homepage)
+        app.router.add_get("/wiki/{title}", self.homepage)
+        return app
+
+    async def start(self):
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _simulate(self, request: web.Request, handler):
+        self.requests += 1
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.rng.random() < self.error_rate:
+            return web.Response(status=503, text="stand-in error")
+        return await handler(request)
+
+    async def serpapi_search(self, request: web.Request) -> web.Response:
+        name = request.query.get("q", "").replace(" official website", "")
+        return web.json_response({
+            "organic_results": [
+                {"link": f"{self.base_url}/site/{slugify(name)}/", "title": f"{name} - Official Site"},
+                {"link": f"https://example.com/reviews/{slugify(name)}", "title": f"Reviews of {name}"},
+            ]
+        })
+
+    async def mediawiki_api(self, request: web.Request) -> web.Response:
+        query = request.query
+        version2 = query.get("formatversion") == "2"
+
+        if query.get("action") == "parse":
+            name = self.pages.get(int(query.get("pageid", 0)), "Unknown")
+            return web.json_response({"parse": {"wikitext": {"*": self.wikitext(name)}}})
+
+        if query.get("list") == "search":
+            name = query.get("srsearch", "")
+            pid = page_id(name)
+            self.pages[pid] = name
+            return web.json_response({"query": {"search": [{"pageid": pid, "title": name}]}})
+
+        pages: List[Dict[str, Any]] = []
+        for pid in (int(p) for p in query.get("pageids", "").split("|") if p):
+            name = self.pages.get(pid)
+            if name is None:
+                pages.append({"pageid": pid, "missing": True})
+            elif query.get("prop") == "revisions":
+                pages.append({"pageid": pid, "revisions": [{"slots": {"main": {"content": self.wikitext(name)}}}]})
+            else:
+                pages.append({"pageid": pid, "title": name, "extract": self.extract(name)})
+
+        if version2:
+            return web.json_response({"query": {"pages": pages}})
+        return web.json_response({"query": {"pages": {str(page["pageid"]): page for page in pages}}})
+
+    async def homepage(self, request: web.Request) -> web.Response:
+        name = request.match_info.get("slug") or request.match_info.get("title", "")
+        return web.Response(body=self.html(name), content_type="text/html", charset="utf-8")
+
+    def _pick(self, name: str, options: List[str], salt: int = 0) -> str:
+        return options[(page_id(name) + salt) % len(options)]
+
+    def extract(self, name: str) -> str:
+        year = 1990 + page_id(name) % 34
+        return (
+            f"{name} is a {self._pick(name, INDUSTRIES)} company founded in {year} by Alex Doe and Sam Roe. "
+            f"It is headquartered in {self._pick(name, CITIES)}. "
+            f"The company also works in {self._pick(name, INDUSTRIES, 3)}."
+        )
+
+    def wikitext(self, name: str) -> str:
+        return (
+            "{{Infobox company\n"
+            f"|name = {name}\n"
+            f"|num_employees = {page_id(name) % 5000 + 10}\n"
+            f"|revenue = {{{{increase}}}} {{{{US$|{page_id(name) % 900 + 1} million}}}}\n"
+            "}}"
+        )
+
+    def html(self, name: str) -> bytes:
+        head = (
+            f"<!DOCTYPE html><html><head><title>{name}</title>"
+            f'<meta name="description" content="{name} builds {self._pick(name, INDUSTRIES)} products.">'
+            "</head><body>"
+        )
+        body = "".join(f'<a href="https://{site}/{slugify(name)}">{site}</a>' for site in SOCIAL)
+        body += "<ul>" + "".join(f'<li class="product">{name} Product {i}</li>' for i in range(5)) + "</ul>"
+        filler = "<p>" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8 + "</p>"
+        page = head + body
+        while len(page) < self.page_bytes:
+            page += filler
+        return (page + "</body></html>").encode()
+
+
+async def serve(server: StandinServer):
+    await server.start()
+    print(f"stand-in listening on {server.base_url}")
+    for key, value in server.env().items():
+        print(f"export {key}={value}")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--page-kb", type=int, default=64)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StandinServer(
+        args.host,
+        args.port,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        page_bytes=args.page_kb * 1024,
+        error_rate=args.error_rate
+    )
+    try:
+        asyncio.run(serve(server))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,103 +1,370 @@
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import asyncio
+import json
+import time
 import uvicorn
 import logging
 import os
-from pathlib import Path
+from contextlib import asynccontextmanager
 
-from app.services.database import DatabaseService
+from app.services.async_database import (
+    AsyncDatabaseService,
+    get_async_database_service,
+    close_async_database_service
+)
+from app.services.connection_pool import close_pools
+from app.services.startup_writer import get_startup_writer, close_startup_writer
 from app.services.research_service import ResearchService
+from app.services.scheduler import get_scheduler
+from app.services.circuit_breaker import get_circuit_breakers
+from app.services.http_client import get_http_client
+from app.services.html_parser import close_parser_pool
+from app.services.http_cache import close_response_cache
+from app.services.job_queue import ResearchJobQueue, get_job_queue, close_job_queue
 from app.models.startup import Startup
+from app.services.database import STARTUP_FIELDS
+from app import config
+from app.logging_config import setup_logging
+from app.services.metrics import REGISTRY, register_scheduler_gauges, server_timing_header, start_request_timings
+from app.services.single_flight import get_single_flight
 
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(log_dir / "app.log"),
-        logging.StreamHandler()
-    ]
-)
+setup_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Startup Research API")
+# responses assembled from stored JSON skip response_model validation; orjson encodes them faster when installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    FastJSONResponse = JSONResponse
+
+
+def register_gauges(job_queue: ResearchJobQueue):
+    register_scheduler_gauges(get_scheduler().stats)
+    REGISTRY.gauge(
+        "research_job_items", "Queued research job items by status", ("status",),
+        callback=lambda: {(status,): count for status, count in job_queue.store.counts().items()}
+    )
+    REGISTRY.gauge(
+        "startup_writer_pending", "Research results buffered for the next database write",
+        callback=lambda: {(): get_startup_writer().pending}
+    )
+    REGISTRY.gauge(
+        "research_coalesced_in_flight", "Distinct companies being researched in this process",
+        callback=lambda: {(): get_single_flight().inflight}
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # schema setup and migrations run once here instead of on every request
+    await asyncio.to_thread(get_async_database_service)
+    http_client = get_http_client()
+    await http_client.start()
+    # jobs interrupted by a crash or restart are picked up again here
+    job_queue = await asyncio.to_thread(get_job_queue)
+    await job_queue.start()
+    register_gauges(job_queue)
+    try:
+        yield
+    finally:
+        await close_job_queue()
+        await http_client.close()
+        close_parser_pool()
+        # hit times kept in memory are written back before the cache closes
+        close_response_cache()
+        # final flush of buffered research results before the database goes away
+        await close_startup_writer()
+        close_async_database_service()
+        close_pools()
+
+
+app = FastAPI(title="Startup Research API", lifespan=lifespan)
 
 class StartupRequest(BaseModel):
     startups: List[str]
+    priority: Optional[int] = None
+    bypass_cache: bool = False
+    # refetch every source even when the stored data is still within its max age
+    force: bool = False
+    # seconds each company's research may take before whatever is found is returned (default RESEARCH_DEADLINE)
+    deadline: Optional[float] = None
+    # "ndjson" or "sse" streams each startup as it completes instead of one JSON array
+    stream: Optional[str] = None
+
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+class JobRequest(BaseModel):
+    startups: List[str]
+    priority: Optional[int] = None
+    bypass_cache: bool = False
+    # refetch every source even when the stored data is still within its max age
+    force: bool = False
 
 class ChatRequest(BaseModel):
     query: str
+    limit: int = 20
+    offset: int = 0
 
 
 def get_db_service():
-    return DatabaseService()
+    return get_async_database_service()
+
+
+def get_research_service(db_service: AsyncDatabaseService = Depends(get_db_service)):
+    return ResearchService(db_service, writer=get_startup_writer())
+
 
+def stream_format_from_accept(accept: str) -> Optional[str]:
+    for stream, media_type in STREAM_MEDIA_TYPES.items():
+        if media_type in accept:
+            return stream
+    return None
 
-def get_research_service(db_service: DatabaseService = Depends(get_db_service)):
-    return ResearchService(db_service)
+
+def format_stream_record(record: Dict[str, Any], stream: str) -> str:
+    data = json.dumps(record)
+    if stream == "sse":
+        return f"event: {record['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+async def stream_research(research_service: ResearchService, request: StartupRequest, stream: str):
+    timings = start_request_timings()
+    started = time.perf_counter()
+    completed = failed = partial = 0
+    try:
+        async for index, startup in research_service.iter_research(
+            request.startups,
+            priority=request.priority,
+            bypass_cache=request.bypass_cache,
+            force=request.force,
+            deadline=request.deadline
+        ):
+            completed += 1
+            # research_startup returns a bare Startup without an id when it fails
+            if startup.id is None:
+                failed += 1
+            elif startup.missing_fields:
+                partial += 1
+            record = {"type": "startup", "index": index, "data": startup.model_dump(mode="json")}
+            yield format_stream_record(record, stream)
+    except Exception as e:
+        logger.error("Error streaming research results: %s", e)
+        yield format_stream_record({"type": "error", "detail": str(e)}, stream)
+    
+    summary = {
+        "type": "summary",
+        "requested": len(request.startups),
+        "completed": completed,
+        "failed": failed,
+        "partial": partial,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        # seconds per stage summed over all companies, so stages can exceed the elapsed time
+        "timings": {stage: round(seconds, 3) for stage, seconds in timings.items()}
+    }
+    yield format_stream_record(summary, stream)
 
 
 @app.post("/api/research", response_model=List[Startup])
 async def research_startups(
     request: StartupRequest,
+    http_request: Request,
+    response: Response,
     research_service: ResearchService = Depends(get_research_service)
 ):
     if not request.startups:
         raise HTTPException(status_code=400, detail="No startups provided")
     
-    results = await research_service.research_startups(request.startups)
+    stream = request.stream or stream_format_from_accept(http_request.headers.get("accept", ""))
+    if stream:
+        if stream not in STREAM_MEDIA_TYPES:
+            raise HTTPException(status_code=400, detail=f"Unsupported stream format: {stream}")
+        return StreamingResponse(
+            stream_research(research_service, request, stream),
+            media_type=STREAM_MEDIA_TYPES[stream],
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
+    timings = start_request_timings()
+    results = await research_service.research_startups(
+        request.startups,
+        priority=request.priority,
+        bypass_cache=request.bypass_cache,
+        force=request.force,
+        deadline=request.deadline
+    )
+    if timings:
+        response.headers["Server-Timing"] = server_timing_header(timings)
     return results
 
-@app.get("/api/startups", response_model=List[Startup])
+@app.post("/api/jobs", response_model=Dict[str, Any], status_code=202)
+async def create_research_job(
+    request: JobRequest,
+    job_queue: ResearchJobQueue = Depends(get_job_queue)
+):
+    if not request.startups:
+        raise HTTPException(status_code=400, detail="No startups provided")
+    
+    priority = request.priority if request.priority is not None else config.PRIORITY_BULK
+    job_id = await job_queue.submit(request.startups, priority, request.bypass_cache, request.force)
+    return {"id": job_id, "status": "queued", "total": len(request.startups)}
+
+@app.get("/api/jobs/{job_id}", response_model=Dict[str, Any])
+async def get_research_job(
+    job_id: str,
+    limit: int = 100,
+    offset: int = 0,
+    results: bool = False,
+    job_queue: ResearchJobQueue = Depends(get_job_queue)
+):
+    job = await job_queue.get_job(job_id, limit, offset, results)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return FastJSONResponse(job)
+
+@app.get("/metrics")
+async def metrics():
+    # gauges may query the database, so render off the event loop
+    body = await asyncio.to_thread(REGISTRY.render)
+    return Response(body, media_type="text/plain; version=0.0.4")
+
+@app.get("/api/research/stats", response_model=Dict[str, Any])
+async def research_stats():
+    return {**get_scheduler().stats(), "circuits": get_circuit_breakers().stats()}
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in STARTUP_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(requested))
+
+
+def iter_json_array(documents: List[str], chunk_size: int = 50):
+    # documents are already serialized; write them straight out instead of re-validating models
+    yield "["
+    for start in range(0, len(documents), chunk_size):
+        chunk = ",".join(documents[start:start + chunk_size])
+        yield chunk if start == 0 else "," + chunk
+    yield "]"
+
+
+@app.get(
+    "/api/startups",
+    response_model=None,
+    responses={200: {
+        "description": "A page of startups, streamed from their stored JSON",
+        "content": {"application/json": {"schema": {"type": "array", "items": {"anyOf": [
+            {"$ref": "#/components/schemas/Startup"},
+            {"type": "object", "description": "With fields=, only the requested Startup keys"}
+        ]}}}},
+        "headers": {"X-Next-Cursor": {"description": "Cursor for the next page, absent on the last one",
+                                      "schema": {"type": "string"}}}
+    }}
+)
 async def get_all_startups(
-    db_service: DatabaseService = Depends(get_db_service)
+    request: Request,
+    limit: int = Query(config.STARTUPS_PAGE_SIZE, ge=1, le=config.STARTUPS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    industry: Optional[str] = None,
+    founder: Optional[str] = None,
+    headquarters: Optional[str] = None,
+    founded_year: Optional[str] = None,
+    db_service: AsyncDatabaseService = Depends(get_db_service)
 ):
-    return db_service.get_all_startups()
+    try:
+        documents, next_cursor = await db_service.list_startups(
+            limit,
+            cursor,
+            parse_fields(fields),
+            industry=industry,
+            founder=founder,
+            headquarters=headquarters,
+            founded_year=founded_year
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    headers = {}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+    return StreamingResponse(iter_json_array(documents), media_type="application/json", headers=headers)
 
-@app.get("/api/startups/{startup_id}", response_model=Startup)
+@app.get(
+    "/api/startups/{startup_id}",
+    response_model=None,
+    responses={200: {"model": Startup}, 304: {"description": "Not modified since the ETag or date the client sent"}}
+)
 async def get_startup(
     startup_id: str,
-    db_service: DatabaseService = Depends(get_db_service)
+    request: Request,
+    db_service: AsyncDatabaseService = Depends(get_db_service)
 ):
-    startup = db_service.get_startup(startup_id)
-    if not startup:
+    entry = await db_service.get_startup_entry(startup_id)
+    if not entry:
         raise HTTPException(status_code=404, detail="Startup not found")
-    return startup
+    
+    # clients revalidate on every use and get a bodyless 304 while the record is unchanged
+    headers = {"ETag": entry.etag, "Last-Modified": entry.last_modified, "Cache-Control": "no-cache"}
+    if entry.not_modified(request.headers.get("if-none-match"), request.headers.get("if-modified-since")):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+@app.get("/api/analytics/{query_type}", response_model=Dict[str, Any])
+async def get_analytics(
+    query_type: str,
+    db_service: AsyncDatabaseService = Depends(get_db_service)
+):
+    return await db_service.run_analytics(query_type)
 
 @app.post("/api/chat", response_model=Dict[str, Any])
 async def chat_query(
     request: ChatRequest,
-    db_service: DatabaseService = Depends(get_db_service)
+    db_service: AsyncDatabaseService = Depends(get_db_service)
 ):
     query = request.query.lower()
     
     if any(word in query for word in ["industry", "sector", "industries"]):
-        return db_service.run_analytics("industry_count")
+        return await db_service.run_analytics("industry_count")
     
     
     elif any(word in query for word in ["funding", "investment", "money", "raised"]):
-        return db_service.run_analytics("funding_stats")
+        return await db_service.run_analytics("funding_stats")
     
     
     elif any(word in query for word in ["founder", "started", "created"]):
-        startups = db_service.get_all_startups()
-        founders = {s.name: s.founders for s in startups if s.founders}
+        founders = await db_service.get_field_map("founders")
         return {"type": "founders", "data": founders}
     
     
     elif any(word in query for word in ["location", "headquarter", "based", "where"]):
-        startups = db_service.get_all_startups()
-        locations = {s.name: s.headquarters for s in startups if s.headquarters}
+        locations = await db_service.get_field_map("headquarters")
         return {"type": "locations", "data": locations}
     
     
     else:
-        results = db_service.search_startups(query)
-        return {"type": "search_results", "data": [r.model_dump() for r in results]}
+        # any term may match; bm25 ranking puts the best matches first
+        results = await db_service.search(
+            query, limit=request.limit, offset=request.offset, match_all=False, parse=False
+        )
+        return FastJSONResponse({
+            "type": "search_results",
+            "data": [
+                {**r["startup"], "score": r["score"], "snippet": r["snippet"]}
+                for r in results
+            ]
+        })
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -1,8 +1,14 @@
 import os
+import sys
 import asyncio
 import logging
 from app.services.database import DatabaseService
+from app.services.async_database import AsyncDatabaseService
+from app.services.startup_writer import StartupWriter
 from app.services.research_service import ResearchService
+from app.services.http_client import get_http_client
+from app.services.html_parser import close_parser_pool
+from app import config
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,14 +20,20 @@ async def reset_database():
     print("Resetting database...")
     
     try:
-        if os.path.exists("startups.db"):
-            os.remove("startups.db")
-            print("Deleted existing database file")
+        if os.path.exists(config.DATABASE_PATH):
+            os.remove(config.DATABASE_PATH)
+            print(f"Deleted existing database file {config.DATABASE_PATH}")
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(config.DATABASE_PATH + suffix):
+                os.remove(config.DATABASE_PATH + suffix)
     except Exception as e:
         print(f"Error deleting database file: {e}")
     
-    db_service = DatabaseService()
-    research_service = ResearchService(db_service)
+    db_service = AsyncDatabaseService(DatabaseService())
+    http_client = get_http_client()
+    await http_client.start()
+    writer = StartupWriter(db_service)
+    research_service = ResearchService(db_service, http_client=http_client, writer=writer)
     
     startups = [
         "Apple Inc.",
@@ -35,7 +47,13 @@ async def reset_database():
     
     print(f"Researching {len(startups)} startups...")
     
-    results = await research_service.research_startups(startups)
+    try:
+        results = await research_service.research_startups(startups)
+    finally:
+        await http_client.close()
+        close_parser_pool()
+        await writer.close()
+        db_service.close()
     
     print("Database reset complete. Results:")
     for startup in results:
@@ -69,5 +87,14 @@ async def reset_database():
     
     print("\nDatabase is now populated with default startup information")
 
+def migrate_database():
+    print("Migrating database in place...")
+    db_service = DatabaseService()
+    total = db_service.run_analytics("startup_count")["data"]["total"]
+    print(f"Database schema is up to date ({total} startups)")
+
 if __name__ == "__main__":
-    asyncio.run(reset_database()) 
\ No newline at end of file
+    if "--migrate" in sys.argv:
+        migrate_database()
+    else:
+        asyncio.run(reset_database()) 
\ No newline at end of file
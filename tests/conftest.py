@@ -0,0 +1,8 @@
+import os
+import tempfile
+
+# app.config reads the environment at import time; keep tests away from the real database and HTTP cache
+_workdir = tempfile.mkdtemp(prefix="startup_research_tests_")
+os.environ.setdefault("DATABASE_PATH", os.path.join(_workdir, "startups.db"))
+os.environ.setdefault("HTTP_CACHE_ENABLED", "0")
+os.environ.setdefault("LOG_FILE", "")
@@ -0,0 +1,35 @@
+import sqlite3
+
+from app.services.http_cache import CachedResponse, ResponseCache
+
+
+def last_access(path, url):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT last_access FROM http_cache WHERE url = ?", (url,)).fetchone()[0]
+
+
+def test_hits_keep_access_times_in_memory_until_flushed(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResponseCache(path, access_flush_interval=3600)
+    cache.put(CachedResponse("https://example.com/a", 200, b"a"))
+    stored = last_access(path, "https://example.com/a")
+
+    assert cache.get("https://example.com/a").body == b"a"
+    assert last_access(path, "https://example.com/a") == stored
+
+    cache.close()
+    assert last_access(path, "https://example.com/a") > stored
+
+
+def test_eviction_sees_unflushed_hits(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.db"), max_bytes=2, access_flush_interval=3600)
+    cache.put(CachedResponse("https://example.com/old", 200, b"o"))
+    cache.put(CachedResponse("https://example.com/new", 200, b"n"))
+
+    # the older entry was just read, so the newer one is the least recently used
+    assert cache.get("https://example.com/old") is not None
+    cache.put(CachedResponse("https://example.com/third", 200, b"t"))
+
+    assert cache.get("https://example.com/old") is not None
+    assert cache.get("https://example.com/new") is None
+    cache.close()
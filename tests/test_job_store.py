@@ -0,0 +1,50 @@
+import os
+import time
+
+from app.services.job_store import JobStore
+
+
+def _stores(tmp_path):
+    db_path = os.path.join(str(tmp_path), "jobs.db")
+    return JobStore(db_path, owner="worker-a"), JobStore(db_path, owner="worker-b")
+
+
+def _statuses(store, job_id):
+    with store.pool.connection() as conn:
+        rows = conn.execute(
+            "SELECT status FROM research_job_items WHERE job_id = ? ORDER BY position", (job_id,)
+        ).fetchall()
+    return [status for status, in rows]
+
+
+def test_release_only_returns_own_items(tmp_path):
+    a, b = _stores(tmp_path)
+    job_id = a.create_job(["One", "Two", "Three", "Four"], priority=10)
+    assert len(a.claim(2)) == 2
+    assert len(b.claim(2)) == 2
+
+    assert a.release() == 2
+    assert _statuses(a, job_id) == ["pending", "pending", "running", "running"]
+
+    # a's items can be claimed again; b's are still running
+    assert [item.company_name for item in a.claim(4)] == ["One", "Two"]
+
+
+def test_release_stale_skips_items_with_a_recent_heartbeat(tmp_path):
+    a, b = _stores(tmp_path)
+    job_id = a.create_job(["One", "Two"], priority=10)
+    a.claim(1)
+    b.claim(1)
+
+    # worker a stopped sending heartbeats a while ago
+    with a.pool.connection() as conn:
+        conn.execute(
+            "UPDATE research_job_items SET updated_at = ? WHERE owner = ?",
+            (time.time() - 120, "worker-a")
+        )
+        conn.commit()
+    assert b.heartbeat() == 1
+
+    assert b.release_stale(timeout=60) == 1
+    assert _statuses(b, job_id) == ["pending", "running"]
+    assert [item.company_name for item in b.claim(2)] == ["One"]
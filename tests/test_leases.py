@@ -0,0 +1,48 @@
+import time
+
+from app.services.database import DatabaseService
+from app.services.leases import LeaseStore
+
+
+def _stores(ttl=60.0):
+    # DatabaseService creates the research_leases table
+    db_path = DatabaseService().db_path
+    return LeaseStore(db_path, owner="worker-a", ttl=ttl), LeaseStore(db_path, owner="worker-b", ttl=ttl)
+
+
+def test_lease_is_exclusive_until_released():
+    a, b = _stores()
+    assert a.try_acquire("lease-exclusive")
+    assert a.try_acquire("lease-exclusive")
+    assert not b.try_acquire("lease-exclusive")
+
+    # only the owner can drop its lease
+    b.release("lease-exclusive")
+    assert not b.try_acquire("lease-exclusive")
+
+    a.release("lease-exclusive")
+    assert b.try_acquire("lease-exclusive")
+    b.release("lease-exclusive")
+
+
+def test_expired_lease_can_be_taken_over():
+    a, b = _stores(ttl=0.05)
+    assert a.try_acquire("lease-expiry")
+    assert not b.try_acquire("lease-expiry")
+
+    time.sleep(0.1)
+    assert b.try_acquire("lease-expiry")
+    # the previous owner lost it and cannot renew it
+    assert not a.renew("lease-expiry")
+    b.release("lease-expiry")
+
+
+def test_renew_extends_the_lease():
+    a, b = _stores(ttl=0.2)
+    assert a.try_acquire("lease-renew")
+    time.sleep(0.1)
+    assert a.renew("lease-renew")
+    time.sleep(0.15)
+    # past the original expiry, but within the renewed one
+    assert not b.try_acquire("lease-renew")
+    a.release("lease-renew")
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from app.services.pipeline import Stage, StagePipeline
+
+
+def _stage(name, result, order, delay=0.0, depends_on=(), **kwargs):
+    async def func(context, results):
+        order.append(f"start {name}")
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        order.append(f"end {name}")
+        return result
+    return Stage(name, func, depends_on=depends_on, **kwargs)
+
+
+def test_stage_dependencies_must_be_registered_first():
+    pipeline = StagePipeline()
+    with pytest.raises(ValueError):
+        pipeline.add(Stage("fetch", None, depends_on=("search",)))
+
+
+@pytest.mark.asyncio
+async def test_stages_start_once_their_dependencies_finish():
+    order = []
+    pipeline = StagePipeline([
+        _stage("search", "https://example.com", order, delay=0.02),
+        _stage("fetch", {"description": "d"}, order, depends_on=("search",)),
+        _stage("wikipedia", {"industry": ["Tech"]}, order),
+    ])
+
+    results, errors = await pipeline.run({})
+
+    assert errors == {}
+    assert results == {"search": "https://example.com", "fetch": {"description": "d"}, "wikipedia": {"industry": ["Tech"]}}
+    # independent stages overlap; the dependent one waits for its input
+    assert order.index("start wikipedia") < order.index("end search")
+    assert order.index("end search") < order.index("start fetch")
+
+
+@pytest.mark.asyncio
+async def test_timed_out_stage_skips_its_dependents():
+    order = []
+    pipeline = StagePipeline([
+        _stage("search", "https://example.com", order, delay=1.0, timeout=0.05),
+        _stage("fetch", {}, order, depends_on=("search",)),
+        _stage("news", [], order),
+    ])
+
+    results, errors = await pipeline.run({})
+
+    assert results == {"news": []}
+    assert isinstance(errors["search"], asyncio.TimeoutError)
+    # the dependent is recorded with the error that stopped it, and never started
+    assert errors["fetch"] is errors["search"]
+    assert "start fetch" not in order
+
+
+@pytest.mark.asyncio
+async def test_deadline_cuts_off_unfinished_stages():
+    order = []
+    pipeline = StagePipeline([
+        _stage("search", "https://example.com", order, delay=1.0),
+        _stage("news", [], order),
+    ])
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    results, errors = await pipeline.run({}, deadline=start + 0.1)
+
+    assert loop.time() - start < 0.5
+    assert results == {"news": []}
+    assert isinstance(errors["search"], asyncio.TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_only_runs_the_named_stages():
+    order = []
+    pipeline = StagePipeline([
+        _stage("search", "https://example.com", order, source="website"),
+        _stage("fetch", {}, order, depends_on=("search",), source="website"),
+        _stage("news", [], order, source="news"),
+    ])
+
+    results, errors = await pipeline.run({}, pipeline.stages_for(["news"]))
+
+    assert results == {"news": []}
+    assert errors == {}
+    assert order == ["start news", "end news"]
@@ -0,0 +1,116 @@
+import asyncio
+import socket
+from collections import Counter
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+from app import config
+from app.services.research_service import SOURCE_FIELDS
+from app.services.async_database import AsyncDatabaseService
+from app.services.circuit_breaker import CircuitBreakers
+from app.services.database import DatabaseService
+from app.services.http_client import HttpClient
+from app.services.research_service import ResearchService
+from app.services.scheduler import ResearchScheduler
+from app.services.single_flight import SingleFlight
+from benchmarks.standin import StandinServer
+
+
+class CountingStandin(StandinServer):
+    """Stand-in that counts MediaWiki requests by kind; homepages with "broken" in the name fail."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.wikipedia = Counter()
+
+    async def mediawiki_api(self, request):
+        query = request.query
+        self.wikipedia[query.get("list") or query.get("prop") or query.get("action")] += 1
+        return await super().mediawiki_api(request)
+
+    async def homepage(self, request):
+        if "broken" in request.match_info.get("slug", ""):
+            return web.Response(status=503, text="stand-in error")
+        return await super().homepage(request)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def research_env(monkeypatch, max_concurrency: int = 10, host_concurrency: int = 50, latency: float = 0.02):
+    """A counting stand-in and a ResearchService pointed at it."""
+    standin = CountingStandin(port=_free_port(), latency=latency, jitter=0.0, page_bytes=4096)
+    await standin.start()
+    for key, value in standin.env().items():
+        monkeypatch.setattr(config, key, value)
+
+    db_service = AsyncDatabaseService(DatabaseService())
+    http_client = HttpClient()
+    await http_client.start()
+    # every stand-in endpoint shares one host; only its concurrency is limited
+    scheduler = ResearchScheduler(
+        max_concurrency=max_concurrency,
+        host_concurrency={},
+        host_rate_limits={},
+        default_host_concurrency=host_concurrency,
+        default_host_rate=(1e9, 1e9)
+    )
+    service = ResearchService(db_service, scheduler=scheduler, http_client=http_client, single_flight=SingleFlight())
+    service.scraper.breakers = CircuitBreakers()
+    try:
+        yield standin, service
+    finally:
+        await service.writer.close()
+        await http_client.close()
+        db_service.close()
+        await standin.stop()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_batches_look_up_each_company_once(monkeypatch):
+    names = [f"Duplicate Batch Company {i}" for i in range(10)]
+    async with research_env(monkeypatch) as (standin, service):
+        first, second = await asyncio.gather(
+            service.research_startups(names, force=True),
+            service.research_startups(names, force=True)
+        )
+
+    assert [startup.id for startup in first] == [startup.id for startup in second]
+    assert all(startup.founded_year != "N/A" for startup in first)
+    assert standin.wikipedia["search"] == len(names)
+    # the companies still share their extract requests
+    assert standin.wikipedia["extracts"] < len(names)
+
+
+@pytest.mark.asyncio
+async def test_batch_larger_than_the_slot_count_keeps_wikipedia_within_the_deadline(monkeypatch):
+    names = [f"Slot Bound Company {i}" for i in range(100)]
+    async with research_env(monkeypatch, max_concurrency=2, host_concurrency=2, latency=0.01) as (standin, service):
+        service.wikipedia.batch_window = 0.01
+        # each company's deadline starts with its slot, so its Wikipedia lookup must not queue behind the
+        # searches of the companies still waiting for a slot
+        startups = await service.research_startups(names, force=True, deadline=0.3)
+
+    wikipedia_fields = set(SOURCE_FIELDS["wikipedia"])
+    for startup in startups:
+        assert not wikipedia_fields & set(startup.missing_fields or []), startup.name
+        assert "wikipedia" in startup.source_updated
+
+
+@pytest.mark.asyncio
+async def test_failed_website_is_reported_missing_and_not_stamped_fresh(monkeypatch):
+    async with research_env(monkeypatch) as (standin, service):
+        broken, working = await service.research_startups(["Broken Site Company", "Working Site Company"], force=True)
+
+    assert {"description", "products", "social_media"} <= set(broken.missing_fields)
+    assert "website" not in broken.source_updated
+    assert "wikipedia" in broken.source_updated
+
+    assert not working.missing_fields
+    assert "website" in working.source_updated
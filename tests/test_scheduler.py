@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from app import config
+from app.services.scheduler import PrioritySemaphore, ResearchScheduler, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore_serves_lowest_priority_value_first():
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire(config.PRIORITY_BULK)
+    order = []
+
+    async def waiter(name, priority):
+        await semaphore.acquire(priority)
+        order.append(name)
+        semaphore.release()
+
+    tasks = [asyncio.create_task(waiter(f"bulk-{i}", config.PRIORITY_BULK)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(waiter("interactive", config.PRIORITY_INTERACTIVE)))
+    await asyncio.sleep(0)
+    assert semaphore.waiting == 4
+
+    semaphore.release()
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "bulk-0", "bulk-1", "bulk-2"]
+    assert semaphore.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_host_slot_lets_interactive_request_jump_queued_bulk_requests():
+    scheduler = ResearchScheduler(
+        host_concurrency={"example.com": 1},
+        host_rate_limits={},
+        default_host_rate=(1000.0, 1000.0)
+    )
+    busy = asyncio.Event()
+    order = []
+
+    async def hold():
+        async with scheduler.host_slot("https://example.com/held"):
+            await busy.wait()
+
+    async def request(name, priority):
+        async with scheduler.host_slot(f"https://example.com/{name}", priority):
+            order.append(name)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    bulk = [asyncio.create_task(request(f"bulk-{i}", config.PRIORITY_BULK)) for i in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request("interactive", config.PRIORITY_INTERACTIVE))
+    await asyncio.sleep(0)
+    assert scheduler.stats()["hosts"]["example.com"]["waiting"] == 4
+
+    busy.set()
+    await asyncio.gather(holder, *bulk, interactive)
+    assert order == ["interactive", "bulk-0", "bulk-1", "bulk-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_host_waiter_does_not_leak_its_slot():
+    scheduler = ResearchScheduler(
+        host_concurrency={"example.com": 1},
+        host_rate_limits={},
+        default_host_rate=(1000.0, 1000.0)
+    )
+
+    async def request():
+        async with scheduler.host_slot("https://example.com/"):
+            pass
+
+    async with scheduler.host_slot("https://example.com/"):
+        waiter = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    await asyncio.wait_for(request(), 1.0)
+    assert scheduler.hosts["example.com"].semaphore.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests_after_the_burst():
+    bucket = TokenBucket(rate=50.0, capacity=2)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await bucket.acquire()
+    await bucket.acquire()
+    # the burst is served immediately
+    assert loop.time() - start < 0.01
+
+    for _ in range(5):
+        await bucket.acquire()
+    # then one request per 1/rate seconds
+    assert loop.time() - start >= 5 / 50.0 * 0.9
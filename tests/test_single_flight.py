@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    callers = [asyncio.create_task(flight.run("openai", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert flight.inflight == 1
+
+    release.set()
+    assert await asyncio.gather(*callers) == ["result"] * 3
+    assert calls == 1
+    assert flight.inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_work_survives_until_the_last_caller_is_cancelled():
+    flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.create_task(flight.run("openai", work))
+    second = asyncio.create_task(flight.run("openai", work))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.gather(first, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.gather(second, return_exceptions=True)
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert flight.inflight == 0
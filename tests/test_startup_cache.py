@@ -0,0 +1,44 @@
+from app.models.startup import Startup
+from app.services.startup_cache import CachedStartup, StartupCache
+
+
+class FakeVersion:
+    def __init__(self):
+        self.value = 0.0
+        self.reads = 0
+
+    def __call__(self) -> float:
+        self.reads += 1
+        return self.value
+
+
+def _entry(startup_id: str) -> CachedStartup:
+    return CachedStartup(Startup(id=startup_id, name=startup_id), "2024-01-01T00:00:00")
+
+
+def test_get_nowait_needs_a_recent_version_check():
+    version = FakeVersion()
+    cache = StartupCache(max_entries=10, ttl=60, version=version, version_interval=60)
+    cache.put("openai", _entry("openai"), cache.generation)
+
+    # never checked: the caller has to go through get()
+    assert cache.get_nowait("openai") is None
+    assert version.reads == 0
+
+    assert cache.get("openai") is None
+    cache.put("openai", _entry("openai"), cache.generation)
+    assert cache.get_nowait("openai").startup.id == "openai"
+    assert version.reads == 1
+
+
+def test_get_nowait_defers_to_get_once_the_check_is_stale():
+    version = FakeVersion()
+    cache = StartupCache(max_entries=10, ttl=60, version=version, version_interval=0)
+    cache.get("openai")
+    cache.put("openai", _entry("openai"), cache.generation)
+    assert cache.get_nowait("openai") is None
+
+    # another process wrote in the meantime
+    version.value = 1.0
+    assert cache.get("openai") is None
+    assert version.reads == 2